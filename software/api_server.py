@@ -5,18 +5,69 @@ Provides REST API endpoints for hardware control and data access.
 """
 
 import asyncio
+import copy
+import functools
+import gzip
+import json
 import logging
+import mimetypes
 import time
+from collections import OrderedDict
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional, Dict, List, Any
 import sys
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 import yaml
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# orjson-backed responses serialize numeric lists (measurement history,
+# status envelopes) in C instead of the stdlib json encoder.
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+
+    def _orjson_fallback(obj):
+        """Coerce numpy scalars (health-check details, envelopes) to Python."""
+        if NUMPY_AVAILABLE and isinstance(obj, np.generic):
+            return obj.item()
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    class _DefaultResponse(ORJSONResponse):
+        """ORJSONResponse with dataclass support and a numpy-scalar fallback."""
+
+        def render(self, content) -> bytes:
+            return orjson.dumps(
+                content,
+                default=_orjson_fallback,
+                option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NAIVE_UTC
+            )
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    from fastapi.responses import JSONResponse as _DefaultResponse
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
@@ -35,6 +86,7 @@ try:
         MeasurementEnvelope, EmitEnvelope, BudgetEnvelope, SessionStatusEnvelope,
         PulseWidthBounds, NHIDetectionEnvelope,
     )
+    from core.predicates import PredicateEvaluator
     CORE_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"Core modules not available: {e}")
@@ -42,6 +94,10 @@ except ImportError as e:
 
 from hardware_control.nhi_detector import NHIDetector
 
+# PredicateEvaluator is stateless (all-static checks); one shared
+# instance serves every emit request.
+PREDICATE_EVALUATOR = PredicateEvaluator() if CORE_AVAILABLE else None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -53,7 +109,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="EUV Detection & Laser Communication API",
     description="REST API for hardware control and data access",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=_DefaultResponse
 )
 
 # CORS middleware for frontend
@@ -75,8 +132,11 @@ class AppState:
         self.last_measurement_envelope: Optional[MeasurementEnvelope] = None
         self.health_monitor: SystemHealthMonitor = SystemHealthMonitor()
         self.last_health_check: Optional[List] = None
+        # Serialized once per check cycle; /api/health/status returns it as-is
+        self.last_health_check_payload: Optional[Dict] = None
         self.config: Dict = {}
         self._measurement_task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
         
         # FSM-based state management
         self.context: Optional[SessionContext] = None
@@ -85,11 +145,42 @@ class AppState:
         self.session_bundle: Optional[SessionBundle] = None
         self.nhi_detector: Optional[NHIDetector] = None
 
+        # Serialized /api/status body, valid until the next FSM transition
+        self._status_cache: Optional[bytes] = None
+
+        # Hot-path config values, flattened from the nested config dict so
+        # per-tick and per-request code does not walk .get() chains.
+        self.cfg = self._build_cfg({})
+
+    @staticmethod
+    def _build_cfg(config: Dict) -> SimpleNamespace:
+        """Flatten hot-path config values into a namespace."""
+        encoding = config.get('signal_processing', {}).get('encoding', {})
+        return SimpleNamespace(
+            update_rate_s=config.get('preferences', {}).get('update_rate', 1.0),
+            pulse_dur_s=encoding.get('pulse_duration', 0.1),
+            gap_dur_s=encoding.get('gap_duration', 0.1),
+            max_power_mw=config.get('safety', {}).get('max_power_mw', 1.0),
+            history_length=config.get('preferences', {}).get('history_length', 100),
+        )
+
+    def _rebind_config(self):
+        """
+        Re-derive flattened hot-path values from self.config.
+
+        Builds a fresh namespace and swaps it in one assignment, so
+        concurrent readers (measurement loop, request handlers) see
+        either the old or the new set, never a mix.
+        """
+        self.cfg = self._build_cfg(self.config or {})
+
 app_state = AppState()
 
 # Trace writer callback for FSM transitions
 def trace_transition_callback(transition_info: Dict[str, Any]):
     """Callback for FSM transitions to write trace records."""
+    # State or budget changed; next /api/status must rebuild its body
+    app_state._status_cache = None
     if app_state.trace_writer and CORE_AVAILABLE:
         try:
             event_type = EventType.STATE_TRANSITION
@@ -105,18 +196,95 @@ def trace_transition_callback(transition_info: Dict[str, Any]):
                 config_hash=app_state.context.config_hash if app_state.context else None,
                 cal_hash=app_state.context.cal_hash if app_state.context else None
             )
+            # Fault records must hit disk even if the buffered writer's
+            # batch window has not elapsed yet
+            if event_type == EventType.FAULT:
+                app_state.trace_writer.flush()
         except Exception as e:
             logger.error(f"Trace write error: {e}")
 
+# Prefer the libyaml C loader when available; it is much faster than the
+# pure-Python SafeLoader for multi-KB configs.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed-YAML cache: path -> (mtime_ns, size, parsed_dict).
+# Avoids re-parsing the same config file on repeated loads (startup,
+# /api/initialize, reloads). Entries are validated against stat() results.
+_YAML_CACHE: 'OrderedDict[str, tuple]' = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+def _cached_yaml_load(path: Path) -> Dict:
+    """
+    Load and parse a YAML file, caching the parsed result keyed by path.
+
+    Cache entries are validated against (st_mtime_ns, st_size) so edits to
+    the file invalidate the cache. Returns a deep copy so callers can
+    mutate the result without corrupting the cache.
+    """
+    key = str(path)
+    stat = path.stat()
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    # JSON sidecar: parsing JSON is C-level and much faster than YAML,
+    # so reuse a sidecar written by a previous process when it is fresh.
+    sidecar = path.with_name(path.name + '.cache.json')
+    parsed = None
+    try:
+        if sidecar.exists() and sidecar.stat().st_mtime_ns >= stat.st_mtime_ns:
+            with open(sidecar, 'r') as f:
+                parsed = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Config sidecar read failed, falling back to YAML: {e}")
+        parsed = None
+
+    if parsed is None:
+        with open(path, 'r') as f:
+            parsed = yaml.load(f, Loader=_YamlLoader)
+        try:
+            sidecar.write_text(json.dumps(parsed))
+        except OSError as e:
+            logger.debug(f"Could not write config sidecar: {e}")
+
+    _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, parsed)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(parsed)
+
+# Device config lives at a fixed location; resolve it once at import
+_CONFIG_PATH = Path(__file__).parent / "config" / "device_config.yaml"
+
+@functools.lru_cache(maxsize=1)
+def _load_config_and_hash_cached(mtime_ns: int) -> tuple:
+    """
+    Load config + hash via load_config_and_hash, memoized on file mtime.
+
+    Keyed on st_mtime_ns so an edited file re-parses, while repeated
+    startups/initializes pay only a stat(). Callers must deep-copy the
+    returned config before mutating it.
+    """
+    return load_config_and_hash(_CONFIG_PATH)
+
+def load_config_and_hash_cached() -> tuple:
+    """Return (deep-copied config, hash) for the device config file."""
+    config, config_hash = _load_config_and_hash_cached(_CONFIG_PATH.stat().st_mtime_ns)
+    return copy.deepcopy(config), config_hash
+
 # Load configuration
 def load_config() -> Dict:
     """Load device configuration."""
-    config_path = Path(__file__).parent / "config" / "device_config.yaml"
+    config_path = _CONFIG_PATH
     if config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            
+            config = _cached_yaml_load(config_path)
+
             # Validate configuration
             is_valid, errors = validate_config(str(config_path))
             if not is_valid:
@@ -131,6 +299,7 @@ def load_config() -> Dict:
         return {}
 
 app_state.config = load_config()
+app_state._rebind_config()
 
 # Pydantic models for request/response
 class InitializeRequest(BaseModel):
@@ -163,11 +332,22 @@ class StatusResponse(BaseModel):
 
 # Background task for continuous measurements
 async def measurement_loop():
-    """Background task for continuous measurements. Uses envelope-based output."""
+    """
+    Background task for continuous measurements. Uses envelope-based output.
+
+    Sleeps on a stop event rather than a bare asyncio.sleep so that
+    stop_measurement() wakes the loop immediately instead of waiting out
+    the remainder of the update interval.
+    """
+    stop_event = app_state._stop_event
     while app_state.measurement_running:
         try:
             if app_state.photodiode_reader:
-                envelope = app_state.photodiode_reader.get_measurement_envelope()
+                # ADC sampling blocks on I2C reads and inter-sample sleeps;
+                # run it off the event loop so HTTP requests stay responsive.
+                envelope = await asyncio.to_thread(
+                    app_state.photodiode_reader.get_measurement_envelope
+                )
                 app_state.last_measurement_envelope = envelope
                 # Derive point values for history from envelope center
                 wavelength = None
@@ -183,8 +363,11 @@ async def measurement_loop():
                     app_state.signal_processor.add_measurement(
                         wavelength, voltage, laser_state
                     )
-            update_rate = app_state.config.get('preferences', {}).get('update_rate', 1.0)
-            await asyncio.sleep(update_rate)
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=app_state.cfg.update_rate_s)
+                break  # Stop requested
+            except asyncio.TimeoutError:
+                pass  # Interval elapsed, take next measurement
         except Exception as e:
             logger.error(f"Measurement error: {e}")
             app_state.measurement_running = False
@@ -205,11 +388,37 @@ async def get_config():
     """Get device configuration."""
     return app_state.config
 
+def fsm_endpoint(operation: str):
+    """
+    Shared error handling for FSM-driven endpoints.
+
+    Translates FSMError to HTTP 400 and anything else to HTTP 500,
+    logging with the given operation name. HTTPExceptions raised by the
+    endpoint body pass through untouched. Keeps the try/except scaffold
+    out of each handler and gives one chokepoint for instrumentation.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except FSMError as e:
+                logger.error(f"FSM error during {operation}: {e}")
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                logger.error(f"Failed to {operation}: {e}")
+                raise HTTPException(status_code=500, detail=str(e))
+        return wrapper
+    return decorator
+
 @app.post("/api/initialize")
+@fsm_endpoint("initialize hardware")
 async def initialize_hardware():
     """
     Initialize hardware and transition to INITIALIZED state.
-    
+
     This endpoint triggers SAFE→INITIALIZED transition:
     - Loads config and calibration
     - Computes and binds hashes
@@ -218,183 +427,154 @@ async def initialize_hardware():
     """
     if not CORE_AVAILABLE:
         raise HTTPException(status_code=500, detail="Core modules not available")
-    
-    try:
-        # Initialize hardware components first
-        if app_state.photodiode_reader is None:
-            photodiode_config = app_state.config.get('hardware', {}).get('photodiode', {})
-            app_state.photodiode_reader = PhotodiodeReader(
-                i2c_address=photodiode_config.get('i2c_address', 0x48),
-                adc_channel=photodiode_config.get('adc_channel', 0),
-                gain=photodiode_config.get('gain', 1),
-                sample_rate=photodiode_config.get('sample_rate', 250)
-            )
-        
-        if app_state.laser_controller is None:
-            laser_config = app_state.config.get('hardware', {}).get('laser', {})
-            app_state.laser_controller = LaserController(
-                laser_pin=laser_config.get('laser_pin', 18),
-                interlock_pin=laser_config.get('interlock_pin', 23),
-                pwm_frequency=laser_config.get('pwm_frequency', 1000),
-                pulse_duration=laser_config.get('pulse_duration', 0.001)
-            )
-        
-        if app_state.signal_processor is None:
-            log_dir = app_state.config.get('logging', {}).get('log_dir', 'logs')
-            app_state.signal_processor = SignalProcessor(log_dir=log_dir)
-            if app_state.config.get('logging', {}).get('auto_start_session', True):
-                app_state.signal_processor.start_logging_session()
-        
-        if app_state.nhi_detector is None:
-            app_state.nhi_detector = NHIDetector.from_config(app_state.config)
-        
-        # Initialize FSM context if not exists
-        if app_state.context is None:
-            config_path = Path(__file__).parent / "config" / "device_config.yaml"
-            
-            # Load config and compute hash
-            config, config_hash = load_config_and_hash(config_path)
-            
-            # Load calibration and compute hash
-            calibration, cal_hash = load_calibration_and_hash(app_state.photodiode_reader)
-            
-            # Create session context
-            app_state.context = SessionContext(
-                config=config,
-                config_hash=config_hash,
-                calibration=calibration,
-                cal_hash=cal_hash,
-                photodiode_reader=app_state.photodiode_reader,
-                laser_controller=app_state.laser_controller,
-                signal_processor=app_state.signal_processor,
-                health_monitor=app_state.health_monitor,
-                simulation_mode=config.get('advanced', {}).get('simulation_mode', False)
-            )
-            
-            # Set up trace writer
-            session_dir = Path(log_dir) / "sessions" / app_state.context.session_id
-            trace_file = session_dir / "trace.jsonl"
-            app_state.trace_writer = TraceWriter(trace_file, app_state.context.session_id)
-            
-            # Create FSM with trace callback
-            app_state.fsm = FSM(app_state.context, trace_transition_callback)
-            
-            # Create session bundle
-            app_state.session_bundle = SessionBundle(session_dir, app_state.context, app_state.trace_writer)
-            
-            # Record initial health check
-            health_checks = app_state.health_monitor.run_all_checks(
-                app_state.photodiode_reader,
-                app_state.laser_controller,
-                log_dir
-            )
-            health_data = {
-                "overall_status": app_state.health_monitor.get_overall_status()[0].value,
-                "overall_message": app_state.health_monitor.get_overall_status()[1],
-                "checks": [
-                    {
-                        "name": c.name,
-                        "status": c.status.value,
-                        "message": c.message,
-                        "details": c.details
-                    }
-                    for c in health_checks
-                ],
-                "timestamp": time.time()
-            }
-            app_state.session_bundle.set_health_start(health_data)
-        
-        # Transition SAFE → INITIALIZED
-        if app_state.context.state != FSMState.SAFE:
-            raise HTTPException(status_code=400, detail=f"Must be in SAFE state, currently {app_state.context.state.value}")
-        
-        success, message, transition_info = app_state.fsm.transition(FSMEvent.INITIALIZE)
-        
-        if not success:
-            raise HTTPException(status_code=500, detail=f"Initialization failed: {message}")
-        
-        return {
-            "status": "success",
-            "message": message,
-            "state": app_state.context.state.value,
-            "config_hash": app_state.context.config_hash,
-            "cal_hash": app_state.context.cal_hash,
-            "session_id": app_state.context.session_id
-        }
-    except FSMError as e:
-        logger.error(f"FSM error during initialization: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to initialize hardware: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+
+    # Initialize hardware components first
+    if app_state.photodiode_reader is None:
+        photodiode_config = app_state.config.get('hardware', {}).get('photodiode', {})
+        app_state.photodiode_reader = PhotodiodeReader(
+            i2c_address=photodiode_config.get('i2c_address', 0x48),
+            adc_channel=photodiode_config.get('adc_channel', 0),
+            gain=photodiode_config.get('gain', 1),
+            sample_rate=photodiode_config.get('sample_rate', 250)
+        )
+
+    if app_state.laser_controller is None:
+        laser_config = app_state.config.get('hardware', {}).get('laser', {})
+        app_state.laser_controller = LaserController(
+            laser_pin=laser_config.get('laser_pin', 18),
+            interlock_pin=laser_config.get('interlock_pin', 23),
+            pwm_frequency=laser_config.get('pwm_frequency', 1000),
+            pulse_duration=laser_config.get('pulse_duration', 0.001)
+        )
+
+    if app_state.signal_processor is None:
+        log_dir = app_state.config.get('logging', {}).get('log_dir', 'logs')
+        app_state.signal_processor = SignalProcessor(log_dir=log_dir)
+        if app_state.config.get('logging', {}).get('auto_start_session', True):
+            app_state.signal_processor.start_logging_session()
+
+    if app_state.nhi_detector is None:
+        app_state.nhi_detector = NHIDetector.from_config(app_state.config)
+
+    # Initialize FSM context if not exists
+    if app_state.context is None:
+        # Load config and compute hash (mtime-cached)
+        config, config_hash = load_config_and_hash_cached()
+
+        # Load calibration and compute hash
+        calibration, cal_hash = load_calibration_and_hash(app_state.photodiode_reader)
+
+        # Create session context
+        app_state.context = SessionContext(
+            config=config,
+            config_hash=config_hash,
+            calibration=calibration,
+            cal_hash=cal_hash,
+            photodiode_reader=app_state.photodiode_reader,
+            laser_controller=app_state.laser_controller,
+            signal_processor=app_state.signal_processor,
+            health_monitor=app_state.health_monitor,
+            simulation_mode=config.get('advanced', {}).get('simulation_mode', False)
+        )
+
+        # Set up trace writer
+        session_dir = Path(log_dir) / "sessions" / app_state.context.session_id
+        trace_file = session_dir / "trace.jsonl"
+        # Buffered: transitions enqueue the record and a writer thread
+        # batches the disk appends off the FSM hot path
+        app_state.trace_writer = TraceWriter(trace_file, app_state.context.session_id,
+                                             buffered=True)
+
+        # Create FSM with trace callback
+        app_state.fsm = FSM(app_state.context, trace_transition_callback)
+
+        # Create session bundle
+        app_state.session_bundle = SessionBundle(session_dir, app_state.context, app_state.trace_writer)
+
+        # Record initial health check
+        health_checks = app_state.health_monitor.run_all_checks(
+            app_state.photodiode_reader,
+            app_state.laser_controller,
+            log_dir
+        )
+        health_data = dict(_cache_health_payload(health_checks))
+        health_data["timestamp_ns"] = time.time_ns()
+        app_state.session_bundle.set_health_start(health_data)
+
+    # Transition SAFE → INITIALIZED
+    if app_state.context.state != FSMState.SAFE:
+        raise HTTPException(status_code=400, detail=f"Must be in SAFE state, currently {app_state.context.state_str}")
+
+    success, message, transition_info = app_state.fsm.transition(FSMEvent.INITIALIZE)
+
+    if not success:
+        raise HTTPException(status_code=500, detail=f"Initialization failed: {message}")
+
+    return {
+        "status": "success",
+        "message": message,
+        "state": app_state.context.state_str,
+        "config_hash": app_state.context.config_hash,
+        "cal_hash": app_state.context.cal_hash,
+        "session_id": app_state.context.session_id
+    }
 
 @app.post("/api/arm")
+@fsm_endpoint("arm system")
 async def arm_system():
     """
     Arm the system: transition INITIALIZED → ARMED.
-    
+
     Requires: interlock safe, no outstanding faults, cooldown satisfied.
     """
     if not CORE_AVAILABLE or app_state.fsm is None:
         raise HTTPException(status_code=400, detail="System not initialized")
-    
-    try:
-        if app_state.context.state != FSMState.INITIALIZED:
-            raise HTTPException(status_code=400, detail=f"Must be in INITIALIZED state, currently {app_state.context.state.value}")
-        
-        success, message, transition_info = app_state.fsm.transition(FSMEvent.ARM)
-        
-        if not success:
-            raise HTTPException(status_code=400, detail=f"Arming failed: {message}")
-        
-        return {
-            "status": "success",
-            "message": message,
-            "state": app_state.context.state.value
-        }
-    except FSMError as e:
-        logger.error(f"FSM error during arming: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to arm system: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+
+    if app_state.context.state != FSMState.INITIALIZED:
+        raise HTTPException(status_code=400, detail=f"Must be in INITIALIZED state, currently {app_state.context.state_str}")
+
+    success, message, transition_info = app_state.fsm.transition(FSMEvent.ARM)
+
+    if not success:
+        raise HTTPException(status_code=400, detail=f"Arming failed: {message}")
+
+    return {
+        "status": "success",
+        "message": message,
+        "state": app_state.context.state_str
+    }
 
 @app.post("/api/arm/confirm")
+@fsm_endpoint("confirm arm")
 async def confirm_arm():
     """
     Confirm arm: transition ARMED → EMIT_READY.
-    
+
     Must be called within arming window.
     """
     if not CORE_AVAILABLE or app_state.fsm is None:
         raise HTTPException(status_code=400, detail="System not initialized")
-    
-    try:
-        if app_state.context.state != FSMState.ARMED:
-            raise HTTPException(status_code=400, detail=f"Must be in ARMED state, currently {app_state.context.state.value}")
-        
-        success, message, transition_info = app_state.fsm.transition(FSMEvent.ARM_CONFIRM)
-        
-        if not success:
-            raise HTTPException(status_code=400, detail=f"Arm confirmation failed: {message}")
-        
-        return {
-            "status": "success",
-            "message": message,
-            "state": app_state.context.state.value
-        }
-    except FSMError as e:
-        logger.error(f"FSM error during arm confirmation: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to confirm arm: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+
+    if app_state.context.state != FSMState.ARMED:
+        raise HTTPException(status_code=400, detail=f"Must be in ARMED state, currently {app_state.context.state_str}")
+
+    success, message, transition_info = app_state.fsm.transition(FSMEvent.ARM_CONFIRM)
+
+    if not success:
+        raise HTTPException(status_code=400, detail=f"Arm confirmation failed: {message}")
+
+    return {
+        "status": "success",
+        "message": message,
+        "state": app_state.context.state_str
+    }
 
 @app.post("/api/stop")
+@fsm_endpoint("stop system")
 async def stop_system():
     """
     Stop system: transition to safer state or reset from FAULT.
-    
+
     EMITTING → EMIT_READY
     EMIT_READY → ARMED
     ARMED → INITIALIZED
@@ -403,32 +583,25 @@ async def stop_system():
     """
     if not CORE_AVAILABLE or app_state.fsm is None:
         raise HTTPException(status_code=400, detail="System not initialized")
-    
-    try:
-        current_state = app_state.context.state
-        
-        # Determine event based on current state
-        if current_state == FSMState.FAULT:
-            event = FSMEvent.RESET
-        else:
-            event = FSMEvent.STOP
-        
-        success, message, transition_info = app_state.fsm.transition(event)
-        
-        if not success:
-            raise HTTPException(status_code=400, detail=f"Stop failed: {message}")
-        
-        return {
-            "status": "success",
-            "message": message,
-            "state": app_state.context.state.value
-        }
-    except FSMError as e:
-        logger.error(f"FSM error during stop: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to stop system: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+
+    current_state = app_state.context.state
+
+    # Determine event based on current state
+    if current_state == FSMState.FAULT:
+        event = FSMEvent.RESET
+    else:
+        event = FSMEvent.STOP
+
+    success, message, transition_info = app_state.fsm.transition(event)
+
+    if not success:
+        raise HTTPException(status_code=400, detail=f"Stop failed: {message}")
+
+    return {
+        "status": "success",
+        "message": message,
+        "state": app_state.context.state_str
+    }
 
 @app.get("/api/status")
 async def get_status():
@@ -453,6 +626,12 @@ async def get_status():
             "state": "LEGACY"
         }
     
+    # Status only changes across FSM transitions, which clear this cache;
+    # polled requests in between reuse the serialized body.
+    cached = app_state._status_cache
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     # Create budget envelope
     if app_state.context.budget:
         budget = BudgetEnvelope(
@@ -462,16 +641,18 @@ async def get_status():
         )
     else:
         budget = BudgetEnvelope(0.0, 0.0, 0.0)
-    
+
     # Create session status envelope
     status_envelope = SessionStatusEnvelope(
-        state=app_state.context.state.value,
+        state=app_state.context.state_str,
         budget=budget,
         config_hash=app_state.context.config_hash,
         cal_hash=app_state.context.cal_hash
     )
-    
-    return status_envelope.to_dict()
+
+    body = status_envelope.render()
+    app_state._status_cache = body
+    return Response(content=body, media_type="application/json")
 
 @app.post("/api/measurement/start")
 async def start_measurement():
@@ -480,24 +661,27 @@ async def start_measurement():
         return {"status": "already_running"}
     
     app_state.measurement_running = True
-    
+    app_state._stop_event = asyncio.Event()
+
     # Start background task
     app_state._measurement_task = asyncio.create_task(measurement_loop())
-    
+
     return {"status": "started"}
 
 @app.post("/api/measurement/stop")
 async def stop_measurement():
     """Stop continuous measurement."""
     app_state.measurement_running = False
-    
+
+    if app_state._stop_event:
+        app_state._stop_event.set()
+
     if app_state._measurement_task:
-        app_state._measurement_task.cancel()
         try:
             await app_state._measurement_task
         except asyncio.CancelledError:
             pass
-    
+
     return {"status": "stopped"}
 
 @app.post("/api/measurement/calibrate-dark")
@@ -513,43 +697,25 @@ async def calibrate_dark():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/measurement/current")
-async def get_current_measurement():
+async def get_current_measurement(quantized: bool = False):
     """
     Get current measurement envelope.
-    
+
     Returns MeasurementEnvelope with wavelength and voltage bounds.
+    With quantized=true, bounds are fixed-point integers with an
+    explicit scale — smaller payloads for high-rate UI polling.
     """
     if not app_state.photodiode_reader:
         raise HTTPException(status_code=400, detail="Photodiode reader not initialized")
-    
+
     try:
         # Get measurement envelope
         envelope = app_state.photodiode_reader.get_measurement_envelope()
         app_state.last_measurement_envelope = envelope
-        
-        # Convert to dict for JSON response
-        result = {}
-        if envelope.wavelength_envelope_nm:
-            result["wavelength_envelope_nm"] = {
-                "min_nm": envelope.wavelength_envelope_nm.min_nm,
-                "max_nm": envelope.wavelength_envelope_nm.max_nm,
-                "confidence": envelope.wavelength_envelope_nm.confidence,
-                "valid_until": envelope.wavelength_envelope_nm.valid_until
-            }
-        if envelope.voltage_envelope_v:
-            result["voltage_envelope_v"] = {
-                "min_v": envelope.voltage_envelope_v.min_v,
-                "max_v": envelope.voltage_envelope_v.max_v,
-                "rms_noise": envelope.voltage_envelope_v.rms_noise
-            }
-        if envelope.measurement_quality:
-            result["measurement_quality"] = {
-                "snr_estimate": envelope.measurement_quality.snr_estimate,
-                "saturation_flag": envelope.measurement_quality.saturation_flag,
-                "clipping_flag": envelope.measurement_quality.clipping_flag
-            }
-        
-        return result
+
+        # Straight dict -> orjson bytes, no jsonable_encoder walk
+        content = envelope.to_quantized_dict() if quantized else envelope.to_dict()
+        return _DefaultResponse(content=content)
     except Exception as e:
         logger.error(f"Failed to get measurement envelope: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -560,7 +726,7 @@ async def get_measurement_history():
     if not app_state.signal_processor:
         return {"wavelengths": [], "voltages": []}
     
-    history_length = app_state.config.get('preferences', {}).get('history_length', 100)
+    history_length = app_state.cfg.history_length
     wavelengths = app_state.signal_processor.get_wavelength_history(history_length)
     voltages = app_state.signal_processor.get_voltage_history(history_length)
     
@@ -569,6 +735,29 @@ async def get_measurement_history():
         "voltages": voltages
     }
 
+@app.get("/api/measurement/history.bin")
+async def get_measurement_history_bin(series: str = "voltage"):
+    """
+    Get measurement history as raw little-endian float32 bytes.
+
+    Binary alternative to /api/measurement/history for clients polling
+    long histories: 4 bytes per sample instead of ~15 bytes of JSON.
+    The JSON endpoint remains for back-compat.
+    """
+    if not NUMPY_AVAILABLE:
+        raise HTTPException(status_code=500, detail="NumPy not available")
+    if not app_state.signal_processor:
+        return Response(content=b"", media_type="application/octet-stream")
+
+    if series == "voltage":
+        arr = app_state.signal_processor.get_voltage_history_ndarray(app_state.cfg.history_length)
+    elif series == "wavelength":
+        arr = app_state.signal_processor.get_wavelength_history_ndarray(app_state.cfg.history_length)
+    else:
+        raise HTTPException(status_code=400, detail="series must be 'voltage' or 'wavelength'")
+
+    return Response(content=arr.tobytes(), media_type="application/octet-stream")
+
 
 @app.get("/api/nhi/detection")
 async def get_nhi_detection():
@@ -632,7 +821,7 @@ async def send_nhi_response():
     if app_state.context.state != FSMState.EMIT_READY:
         raise HTTPException(
             status_code=400,
-            detail=f"Must be in EMIT_READY state to send response; current state: {app_state.context.state.value}",
+            detail=f"Must be in EMIT_READY state to send response; current state: {app_state.context.state_str}",
         )
     if not app_state.photodiode_reader or not app_state.nhi_detector:
         raise HTTPException(status_code=400, detail="Photodiode or NHI detector not initialized")
@@ -722,154 +911,131 @@ async def send_pulse(request: PulseRequest):
         raise HTTPException(status_code=500, detail="Failed to send pulse")
 
 @app.post("/api/emit")
+@fsm_endpoint("emit pattern")
 async def emit_pattern(request: PatternRequest):
     """
     Emit pattern: transition EMIT_READY → EMITTING → EMIT_READY.
-    
+
     Validates pattern against emit envelope and budget constraints.
     All emission must go through FSM.
     """
     if not CORE_AVAILABLE or app_state.fsm is None:
         raise HTTPException(status_code=400, detail="System not initialized")
-    
+
     if app_state.context.state != FSMState.EMIT_READY:
-        raise HTTPException(status_code=400, detail=f"Must be in EMIT_READY state, currently {app_state.context.state.value}")
-    
+        raise HTTPException(status_code=400, detail=f"Must be in EMIT_READY state, currently {app_state.context.state_str}")
+
     if not app_state.laser_controller:
         raise HTTPException(status_code=400, detail="Laser controller not initialized")
-    
+
     if not app_state.signal_processor:
         raise HTTPException(status_code=400, detail="Signal processor not initialized")
-    
-    try:
-        # Encode pattern
-        if request.pattern_type == "geometric":
-            if not request.geometric_type:
-                raise HTTPException(status_code=400, detail="geometric_type required for geometric patterns")
-            pattern = app_state.signal_processor.encode_message(
-                request.geometric_type, "geometric"
-            )
-            if request.size:
-                pattern = pattern[:request.size] if len(pattern) >= request.size else pattern
-        else:
-            if not request.message:
-                raise HTTPException(status_code=400, detail="message required for morse/binary patterns")
-            pattern = app_state.signal_processor.encode_message(request.message, request.pattern_type)
-        
-        # Get timing parameters
-        pulse_dur = app_state.config.get('signal_processing', {}).get('encoding', {}).get('pulse_duration', 0.1)
-        gap_dur = app_state.config.get('signal_processing', {}).get('encoding', {}).get('gap_duration', 0.1)
-        
-        # Calculate pattern parameters
-        total_pulses = sum(1 for p in pattern if p)
-        total_gaps = sum(1 for p in pattern if not p)
-        total_duration = (total_pulses * pulse_dur) + (total_gaps * gap_dur)
-        total_duration_ms = total_duration * 1000.0
-        
-        # Calculate duty cycle
-        pulse_time = total_pulses * pulse_dur
-        duty_cycle_percent = (pulse_time / total_duration * 100.0) if total_duration > 0 else 0.0
-        
-        # Create emit envelope
-        t_start = time.monotonic()
-        t_end = t_start + total_duration
-        
-        safety = app_state.config.get('safety', {})
-        max_power_mw = safety.get('max_power_mw', 1.0)
-        
-        emit_envelope = EmitEnvelope(
-            power_mw_max=max_power_mw,
-            duty_cycle_max=100.0,  # Will be constrained by budget
-            t_start=t_start,
-            t_end=t_end,
-            pulse_width_bounds=PulseWidthBounds(
-                min_ms=pulse_dur * 1000.0,
-                max_ms=pulse_dur * 1000.0
-            )
-        )
-        
-        # Validate envelope
-        is_valid, error_msg = app_state.laser_controller.validate_emit_envelope(emit_envelope)
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=f"Invalid emit envelope: {error_msg}")
-        
-        # Check budget availability
-        from core.predicates import PredicateEvaluator
-        evaluator = PredicateEvaluator()
-        budget_ok, budget_info = evaluator.check_budget_available(
-            app_state.context,
-            required_emit_ms=total_duration_ms,
-            required_duty_percent=duty_cycle_percent
-        )
-        
-        if not budget_ok:
-            raise HTTPException(status_code=400, detail=f"Insufficient budget: {budget_info}")
-        
-        # Transition EMIT_READY → EMITTING
-        success, message, transition_info = app_state.fsm.transition(
-            FSMEvent.EMIT_REQUEST,
-            event_data={
-                'required_emit_ms': total_duration_ms,
-                'required_duty_percent': duty_cycle_percent,
-                'emit_duration_ms': total_duration_ms,
-                'duty_percent': duty_cycle_percent
-            }
+
+    # Encode pattern; as an ndarray when numpy is present so truncation is
+    # a view and pulse counting is vectorized.
+    encode = (app_state.signal_processor.encode_message_ndarray
+              if NUMPY_AVAILABLE else app_state.signal_processor.encode_message)
+    if request.pattern_type == "geometric":
+        if not request.geometric_type:
+            raise HTTPException(status_code=400, detail="geometric_type required for geometric patterns")
+        pattern = encode(request.geometric_type, "geometric")
+        if request.size:
+            pattern = pattern[:request.size]
+    else:
+        if not request.message:
+            raise HTTPException(status_code=400, detail="message required for morse/binary patterns")
+        pattern = encode(request.message, request.pattern_type)
+
+    # Get timing parameters
+    pulse_dur = app_state.cfg.pulse_dur_s
+    gap_dur = app_state.cfg.gap_dur_s
+
+    # Calculate pattern parameters in a single pass
+    if NUMPY_AVAILABLE:
+        total_pulses = int(np.count_nonzero(pattern))
+    else:
+        total_pulses = sum(pattern)
+    total_gaps = len(pattern) - total_pulses
+    total_duration = (total_pulses * pulse_dur) + (total_gaps * gap_dur)
+    total_duration_ms = total_duration * 1000.0
+
+    # Calculate duty cycle
+    pulse_time = total_pulses * pulse_dur
+    duty_cycle_percent = (pulse_time / total_duration * 100.0) if total_duration > 0 else 0.0
+
+    # Create emit envelope; integer nanoseconds keeps the window arithmetic
+    # exact over long sessions.
+    t_start_ns = time.monotonic_ns()
+    t_end_ns = t_start_ns + int(total_duration * 1e9)
+
+    max_power_mw = app_state.cfg.max_power_mw
+
+    emit_envelope = EmitEnvelope(
+        power_mw_max=max_power_mw,
+        duty_cycle_max=100.0,  # Will be constrained by budget
+        t_start_ns=t_start_ns,
+        t_end_ns=t_end_ns,
+        pulse_width_bounds=PulseWidthBounds(
+            min_ms=pulse_dur * 1000.0,
+            max_ms=pulse_dur * 1000.0
         )
-        
-        if not success:
-            raise HTTPException(status_code=400, detail=f"Emit transition failed: {message}")
-        
-        # Send pattern
-        pattern_success = app_state.laser_controller.send_pattern(pattern, pulse_dur, gap_dur)
-        
-        # Transition EMITTING → EMIT_READY
-        app_state.fsm.transition(FSMEvent.EMIT_COMPLETE, event_data={
+    )
+
+    # Validate envelope
+    is_valid, error_msg = app_state.laser_controller.validate_emit_envelope(emit_envelope)
+    if not is_valid:
+        raise HTTPException(status_code=400, detail=f"Invalid emit envelope: {error_msg}")
+
+    # Check budget availability
+    budget_ok, budget_info = PREDICATE_EVALUATOR.check_budget_available(
+        app_state.context,
+        required_emit_ms=total_duration_ms,
+        required_duty_percent=duty_cycle_percent
+    )
+
+    if not budget_ok:
+        raise HTTPException(status_code=400, detail=f"Insufficient budget: {budget_info}")
+
+    # Fused EMIT_READY → EMITTING → EMIT_READY cycle: one predicate pass,
+    # completion trace carries the pattern result (no separate EMIT_RESULT
+    # record needed). send_pattern sleeps for the whole pattern duration,
+    # so the cycle runs in a worker thread and the event loop stays free
+    # to serve status polls during long emissions.
+    pattern_success, message, transition_info = await asyncio.to_thread(
+        app_state.fsm.emit_atomic,
+        lambda: app_state.laser_controller.send_pattern(pattern, pulse_dur, gap_dur),
+        {
+            'required_emit_ms': total_duration_ms,
+            'required_duty_percent': duty_cycle_percent,
             'emit_duration_ms': total_duration_ms,
-            'duty_percent': duty_cycle_percent
-        })
-        
-        if not pattern_success:
-            raise HTTPException(status_code=500, detail="Pattern send failed")
-        
-        # Log event
-        if app_state.signal_processor:
-            app_state.signal_processor.log_event(
-                "pattern_sent",
-                f"Sent {request.pattern_type} pattern: {request.message or request.geometric_type}"
-            )
-        
-        # Write emit result trace
-        if app_state.trace_writer:
-            app_state.trace_writer.write_record(
-                event_type=EventType.EMIT_RESULT,
-                state_from=FSMState.EMITTING.value,
-                state_to=FSMState.EMIT_READY.value,
-                event_data={
-                    'pattern_type': request.pattern_type,
-                    'duration_ms': total_duration_ms,
-                    'duty_percent': duty_cycle_percent,
-                    'success': pattern_success
-                },
-                config_hash=app_state.context.config_hash,
-                cal_hash=app_state.context.cal_hash
-            )
-        
-        return {
-            "status": "success",
-            "message": f"Pattern sent",
-            "emit_envelope": {
-                "power_mw_max": emit_envelope.power_mw_max,
-                "duty_cycle_max": emit_envelope.duty_cycle_max,
-                "duration_ms": emit_envelope.duration_ms(),
-            },
-            "trace_seq": transition_info.get('seq')
+            'duty_percent': duty_cycle_percent,
+            'pattern_type': request.pattern_type
         }
-    except FSMError as e:
-        logger.error(f"FSM error during emit: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to emit pattern: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    )
+
+    if app_state.context.state == FSMState.FAULT:
+        raise HTTPException(status_code=400, detail=f"Emit transition failed: {message}")
+
+    if not pattern_success:
+        raise HTTPException(status_code=500, detail="Pattern send failed")
+
+    # Log event
+    if app_state.signal_processor:
+        app_state.signal_processor.log_event(
+            "pattern_sent",
+            f"Sent {request.pattern_type} pattern: {request.message or request.geometric_type}"
+        )
+
+    return {
+        "status": "success",
+        "message": f"Pattern sent",
+        "emit_envelope": {
+            "power_mw_max": emit_envelope.power_mw_max,
+            "duty_cycle_max": emit_envelope.duty_cycle_max,
+            "duration_ms": emit_envelope.duration_ms(),
+        },
+        "trace_seq": transition_info.get('seq')
+    }
 
 # Legacy endpoint for backward compatibility
 @app.post("/api/laser/pattern")
@@ -877,6 +1043,26 @@ async def send_pattern(request: PatternRequest):
     """Legacy endpoint - redirects to /api/emit."""
     return await emit_pattern(request)
 
+def _cache_health_payload(checks) -> Dict:
+    """
+    Serialize a health-check cycle once and cache it for status polls.
+
+    Args:
+        checks: List of HealthCheck results from run_all_checks
+
+    Returns:
+        The serialized payload dict (also stored on app_state)
+    """
+    overall_status, overall_message = app_state.health_monitor.get_overall_status()
+    payload = {
+        "overall_status": overall_status.value,
+        "overall_message": overall_message,
+        "checks": app_state.health_monitor.checks_serialized
+    }
+    app_state.last_health_check = checks
+    app_state.last_health_check_payload = payload
+    return payload
+
 @app.post("/api/health/check")
 async def run_health_check():
     """Run health check."""
@@ -885,49 +1071,22 @@ async def run_health_check():
         app_state.laser_controller,
         app_state.config.get('logging', {}).get('log_dir', 'logs')
     )
-    app_state.last_health_check = checks
-    
-    overall_status, overall_message = app_state.health_monitor.get_overall_status()
-    
-    return {
-        "overall_status": overall_status.value,
-        "overall_message": overall_message,
-        "checks": [
-            {
-                "name": check.name,
-                "status": check.status.value,
-                "message": check.message,
-                "details": check.details
-            }
-            for check in checks
-        ]
-    }
+
+    # Explicit response object skips FastAPI's jsonable_encoder type-walk
+    return _DefaultResponse(content=_cache_health_payload(checks))
 
 @app.get("/api/health/status")
 async def get_health_status():
     """Get health status."""
-    if not app_state.last_health_check:
-        return {
+    if not app_state.last_health_check_payload:
+        return _DefaultResponse(content={
             "overall_status": "unknown",
             "overall_message": "No health check performed",
             "checks": []
-        }
-    
-    overall_status, overall_message = app_state.health_monitor.get_overall_status()
-    
-    return {
-        "overall_status": overall_status.value,
-        "overall_message": overall_message,
-        "checks": [
-            {
-                "name": check.name,
-                "status": check.status.value,
-                "message": check.message,
-                "details": check.details
-            }
-            for check in app_state.last_health_check
-        ]
-    }
+        })
+
+    # Serialization happened when the checks ran; this is a dict handoff
+    return _DefaultResponse(content=app_state.last_health_check_payload)
 
 @app.get("/api/session/bundle")
 async def get_session_bundle():
@@ -939,10 +1098,10 @@ async def get_session_bundle():
     if not CORE_AVAILABLE or app_state.session_bundle is None:
         raise HTTPException(status_code=400, detail="Session bundle not available")
     
-    return {
+    return _DefaultResponse(content={
         "session_id": app_state.context.session_id if app_state.context else None,
-        "session_dir": str(app_state.session_bundle.session_dir) if app_state.session_bundle else None
-    }
+        "session_dir": app_state.session_bundle.session_dir_str if app_state.session_bundle else None
+    })
 
 @app.on_event("startup")
 async def startup_event():
@@ -951,8 +1110,7 @@ async def startup_event():
         try:
             # Initialize context in SAFE state
             if app_state.context is None:
-                config_path = Path(__file__).parent / "config" / "device_config.yaml"
-                config, _ = load_config_and_hash(config_path) if config_path.exists() else ({}, "")
+                config, _ = load_config_and_hash_cached() if _CONFIG_PATH.exists() else ({}, "")
                 
                 app_state.context = SessionContext(
                     config=config,
@@ -963,7 +1121,8 @@ async def startup_event():
                 log_dir = config.get('logging', {}).get('log_dir', 'logs')
                 session_dir = Path(log_dir) / "sessions" / app_state.context.session_id
                 trace_file = session_dir / "trace.jsonl"
-                app_state.trace_writer = TraceWriter(trace_file, app_state.context.session_id)
+                app_state.trace_writer = TraceWriter(trace_file, app_state.context.session_id,
+                                                     buffered=True)
                 
                 # Create FSM
                 app_state.fsm = FSM(app_state.context, trace_transition_callback)
@@ -985,20 +1144,8 @@ async def shutdown_event():
                     app_state.laser_controller,
                     log_dir
                 )
-                health_data = {
-                    "overall_status": app_state.health_monitor.get_overall_status()[0].value,
-                    "overall_message": app_state.health_monitor.get_overall_status()[1],
-                    "checks": [
-                        {
-                            "name": c.name,
-                            "status": c.status.value,
-                            "message": c.message,
-                            "details": c.details
-                        }
-                        for c in health_checks
-                    ],
-                    "timestamp": time.time()
-                }
+                health_data = dict(_cache_health_payload(health_checks))
+                health_data["timestamp_ns"] = time.time_ns()
                 app_state.session_bundle.set_health_end(health_data)
             
             # Write bundle
@@ -1006,14 +1153,92 @@ async def shutdown_event():
             logger.info(f"Session bundle written to: {bundle_path}")
         except Exception as e:
             logger.error(f"Shutdown error: {e}")
+    if app_state.trace_writer:
+        app_state.trace_writer.close()
 
 # Serve static files (frontend) in production
 # In development, frontend runs separately
+#
+# Dist assets are immutable for the lifetime of the process, so they are
+# read and pre-compressed once at startup; per-request cost is a dict
+# lookup plus an Accept-Encoding check instead of StaticFiles re-opening
+# the file each time.
 frontend_path = Path(__file__).parent.parent / "frontend" / "dist"
+
+# (media_type, identity_bytes, encoding_name, compressed_bytes) per URL path;
+# identity_bytes is None for large assets, which are served zero-copy from disk
+_static_cache: Dict[str, tuple] = {}
+
+# Cached (path, stat_result) for large assets served via FileResponse/sendfile
+_static_files: Dict[str, tuple] = {}
+
+# Above this size, assets stay on disk and go out through sendfile instead
+# of occupying process memory
+_STATIC_INMEM_MAX = 1 << 20
+
+def _build_static_cache(root: Path):
+    """Index dist files: small ones in memory (pre-compressed), large on disk."""
+    for file_path in root.rglob('*'):
+        if not file_path.is_file():
+            continue
+        url_path = '/' + file_path.relative_to(root).as_posix()
+        media_type = mimetypes.guess_type(file_path.name)[0] or 'application/octet-stream'
+        stat_result = file_path.stat()
+        if stat_result.st_size > _STATIC_INMEM_MAX:
+            _static_files[url_path] = (str(file_path), media_type, stat_result)
+            continue
+        data = file_path.read_bytes()
+        if BROTLI_AVAILABLE:
+            encoding, compressed = 'br', brotli.compress(data, quality=11)
+        else:
+            encoding, compressed = 'gzip', gzip.compress(data, 9)
+        if len(compressed) >= len(data):
+            # Already-compressed assets (images, fonts): skip the sibling
+            encoding, compressed = None, None
+        _static_cache[url_path] = (media_type, data, encoding, compressed)
+
 if frontend_path.exists():
-    app.mount("/", StaticFiles(directory=str(frontend_path), html=True), name="static")
+    from fastapi.responses import FileResponse
+
+    _build_static_cache(frontend_path)
+
+    @app.get("/{asset_path:path}", include_in_schema=False)
+    async def serve_static(asset_path: str, request: Request):
+        """Serve pre-compressed frontend assets from the in-memory cache."""
+        url_path = '/' + asset_path
+        entry = _static_cache.get(url_path)
+        if entry is None:
+            file_entry = _static_files.get(url_path)
+            if file_entry is not None:
+                # Large asset: kernel zero-copy path, stat precomputed
+                disk_path, media_type, stat_result = file_entry
+                return FileResponse(disk_path, media_type=media_type,
+                                    stat_result=stat_result)
+            # SPA routing: unknown paths fall back to index.html
+            entry = _static_cache.get('/index.html')
+            if entry is None:
+                raise HTTPException(status_code=404, detail="Not found")
+        media_type, data, encoding, compressed = entry
+        headers = {"Vary": "Accept-Encoding"}
+        if encoding and encoding in request.headers.get('accept-encoding', ''):
+            headers["Content-Encoding"] = encoding
+            return Response(content=compressed, media_type=media_type, headers=headers)
+        return Response(content=data, media_type=media_type, headers=headers)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    try:
+        import httptools  # noqa: F401 — C HTTP parser, shipped by uvicorn[standard]
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "auto"
+    # Single worker only: app_state (FSM, trace writer, hardware handles)
+    # is in-process and cannot be shared across workers.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if UVLOOP_AVAILABLE else "auto",
+        http=http_impl,
+    )
 
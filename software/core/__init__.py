@@ -6,11 +6,12 @@ for operational closure and structural constraints.
 """
 
 from .context import SessionContext, FSMState, Budget
-from .fsm import FSM, FSMEvent, FSMError
+from .fsm import FSM, FSMEvent, FSMError, TransitionRecord
 from .predicates import PredicateEvaluator
 from .hash_binding import (
     compute_config_hash,
     compute_calibration_hash,
+    compute_file_hash,
     load_config_and_hash,
     load_calibration_and_hash,
     detect_config_drift,
@@ -37,9 +38,11 @@ __all__ = [
     'FSM',
     'FSMEvent',
     'FSMError',
+    'TransitionRecord',
     'PredicateEvaluator',
     'compute_config_hash',
     'compute_calibration_hash',
+    'compute_file_hash',
     'load_config_and_hash',
     'load_calibration_and_hash',
     'detect_config_drift',
@@ -4,15 +4,15 @@ Session Context Module
 Manages session state, configuration hashes, calibration hashes, and budgets.
 """
 
+import os
 import time
-import uuid
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from enum import Enum
 
 
-class FSMState(Enum):
-    """FSM state enumeration."""
+class FSMState(str, Enum):
+    """FSM state enumeration (str-based so serializers emit the name directly)."""
     SAFE = "SAFE"
     INITIALIZED = "INITIALIZED"
     ARMED = "ARMED"
@@ -21,6 +21,14 @@ class FSMState(Enum):
     FAULT = "FAULT"
 
 
+# Each member carries its ordinal so dispatch tables index with one
+# attribute load instead of hashing the string value. The string form
+# stays the canonical wire/trace representation.
+for _idx, _member in enumerate(FSMState):
+    _member.ord = _idx
+del _idx, _member
+
+
 @dataclass
 class Budget:
     """Laser emission budget tracking."""
@@ -50,6 +58,30 @@ class Budget:
         self.last_emit_end_time = current_time
 
 
+@dataclass(slots=True)
+class _Settings:
+    """
+    Hot-path config values, denormalised once per config bind.
+
+    Predicates read these as two attribute loads instead of rebuilding
+    .get() chains (and their empty-dict defaults) on every guard
+    evaluation. Rebuilt whenever config is reassigned; in-place config
+    mutation is already forbidden during a session by hash binding.
+    """
+    cooldown_time_ms: float = 60000.0
+    log_dir: str = 'logs'
+
+
+# Fields whose assignment invalidates version-keyed caches. state is
+# deliberately excluded: it changes on every transition, and the only
+# memoized predicates read config/calibration fields, so bumping on
+# state would empty the cache before any result could be reused.
+_VERSIONED_FIELDS = frozenset({
+    'config', 'calibration', 'config_hash', 'cal_hash',
+    'budget', 'fault_reason', 'simulation_mode',
+})
+
+
 @dataclass
 class SessionContext:
     """
@@ -57,7 +89,8 @@ class SessionContext:
     
     This context is immutable during a session once INITIALIZED.
     """
-    session_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # Opaque 32-hex-char id; os.urandom skips UUID construction/formatting
+    session_id: str = field(default_factory=lambda: os.urandom(16).hex())
     state: FSMState = FSMState.SAFE
     config_hash: Optional[str] = None
     cal_hash: Optional[str] = None
@@ -68,13 +101,55 @@ class SessionContext:
     arming_window_duration_ms: float = 5000.0  # 5 second arming window
     simulation_mode: bool = False
     fault_reason: Optional[str] = None  # Reason for FAULT state
-    
+    # Monotonic change counter: bumped on every assignment to a
+    # session-visible field above, so caches keyed on it (the predicate
+    # memo) invalidate automatically
+    version: int = 0
+
+    # Monotonic clock value captured by the FSM at the start of the
+    # current guard evaluation, so every predicate in a tick shares one
+    # consistent reading. None outside a transition.
+    tick_monotonic: Optional[float] = None
+
     # Hardware references (not part of hash-bound state)
     photodiode_reader: Any = None
     laser_controller: Any = None
     signal_processor: Any = None
     health_monitor: Any = None
-    
+    # Per-version predicate memo, cleared whenever version bumps
+    _predicate_cache: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def __setattr__(self, name: str, value: Any):
+        """
+        Keep state_str and the version counter in lockstep with mutations.
+
+        Endpoints and the session bundle read the state name on every
+        request; caching it here removes the Enum .value lookup from
+        those paths and cannot go stale, since every assignment to
+        state (FSM or direct) passes through this hook; config
+        assignments likewise rebuild the denormalised settings view.
+        Assignments to
+        session-visible fields also bump version and drop the predicate
+        memo, so version-keyed caches can never serve stale results.
+        """
+        object.__setattr__(self, name, value)
+        if name == 'state':
+            object.__setattr__(self, 'state_str', value.value)
+        elif name == 'config':
+            cfg = value or {}
+            object.__setattr__(self, '_settings', _Settings(
+                cooldown_time_ms=cfg.get('safety', {}).get('cooldown_time', 60.0) * 1000.0,
+                log_dir=cfg.get('logging', {}).get('log_dir', 'logs'),
+            ))
+        if name in _VERSIONED_FIELDS:
+            # During dataclass __init__ version does not exist yet
+            current = self.__dict__.get('version')
+            if current is not None:
+                object.__setattr__(self, 'version', current + 1)
+                cache = self.__dict__.get('_predicate_cache')
+                if cache:
+                    cache.clear()
+
     def initialize_budget(self, config: Dict[str, Any]):
         """
         Initialize budget from configuration.
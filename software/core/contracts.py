@@ -5,12 +5,19 @@ Defines the only externally-visible output types as bounded envelopes.
 No semantic point values are allowed.
 """
 
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MeasurementQuality:
     """Measurement quality indicators."""
     snr_estimate: Optional[float] = None  # Signal-to-noise ratio estimate
@@ -18,7 +25,7 @@ class MeasurementQuality:
     clipping_flag: bool = False  # True if measurement clipped
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WavelengthEnvelope:
     """Wavelength measurement envelope."""
     min_nm: float
@@ -31,8 +38,21 @@ class WavelengthEnvelope:
         if self.min_nm > self.max_nm:
             raise ValueError("min_nm must be <= max_nm")
 
+    def to_quantized_dict(self) -> Dict[str, int]:
+        """
+        Fixed-point form for bandwidth-sensitive clients.
 
-@dataclass
+        0.01 nm resolution is ample for UI display; integers encode
+        smaller and faster than full-precision floats.
+        """
+        return {
+            "min_nm_x100": round(self.min_nm * 100),
+            "max_nm_x100": round(self.max_nm * 100),
+            "scale": 100
+        }
+
+
+@dataclass(slots=True, frozen=True)
 class VoltageEnvelope:
     """Voltage measurement envelope."""
     min_v: float
@@ -44,8 +64,16 @@ class VoltageEnvelope:
         if self.min_v > self.max_v:
             raise ValueError("min_v must be <= max_v")
 
+    def to_quantized_dict(self) -> Dict[str, int]:
+        """Fixed-point form (1 mV resolution) for bandwidth-sensitive clients."""
+        return {
+            "min_v_x1000": round(self.min_v * 1000),
+            "max_v_x1000": round(self.max_v * 1000),
+            "scale": 1000
+        }
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MeasurementEnvelope:
     """
     Complete measurement envelope containing wavelength and voltage bounds.
@@ -55,14 +83,62 @@ class MeasurementEnvelope:
     wavelength_envelope_nm: Optional[WavelengthEnvelope] = None
     voltage_envelope_v: VoltageEnvelope = None
     measurement_quality: Optional[MeasurementQuality] = None
-    
+
     def __post_init__(self):
         """Validate that at least one envelope is provided."""
         if self.wavelength_envelope_nm is None and self.voltage_envelope_v is None:
             raise ValueError("At least one envelope (wavelength or voltage) must be provided")
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary for API responses.
 
-@dataclass
+        Absent sub-envelopes are omitted (not emitted as null).
+        """
+        result: Dict[str, Any] = {}
+        if self.wavelength_envelope_nm:
+            result["wavelength_envelope_nm"] = {
+                "min_nm": self.wavelength_envelope_nm.min_nm,
+                "max_nm": self.wavelength_envelope_nm.max_nm,
+                "confidence": self.wavelength_envelope_nm.confidence,
+                "valid_until": self.wavelength_envelope_nm.valid_until
+            }
+        if self.voltage_envelope_v:
+            result["voltage_envelope_v"] = {
+                "min_v": self.voltage_envelope_v.min_v,
+                "max_v": self.voltage_envelope_v.max_v,
+                "rms_noise": self.voltage_envelope_v.rms_noise
+            }
+        if self.measurement_quality:
+            result["measurement_quality"] = {
+                "snr_estimate": self.measurement_quality.snr_estimate,
+                "saturation_flag": self.measurement_quality.saturation_flag,
+                "clipping_flag": self.measurement_quality.clipping_flag
+            }
+        return result
+
+    def to_quantized_dict(self) -> Dict[str, Any]:
+        """
+        Fixed-point variant of to_dict() for bandwidth-sensitive clients.
+
+        Bounds are integers with an explicit per-envelope scale; quality
+        flags are passed through unchanged.
+        """
+        result: Dict[str, Any] = {}
+        if self.wavelength_envelope_nm:
+            result["wavelength_envelope_nm"] = self.wavelength_envelope_nm.to_quantized_dict()
+        if self.voltage_envelope_v:
+            result["voltage_envelope_v"] = self.voltage_envelope_v.to_quantized_dict()
+        if self.measurement_quality:
+            result["measurement_quality"] = {
+                "snr_estimate": self.measurement_quality.snr_estimate,
+                "saturation_flag": self.measurement_quality.saturation_flag,
+                "clipping_flag": self.measurement_quality.clipping_flag
+            }
+        return result
+
+
+@dataclass(slots=True, frozen=True)
 class PulseWidthBounds:
     """Pulse width constraints."""
     min_ms: float
@@ -76,7 +152,7 @@ class PulseWidthBounds:
             raise ValueError("min_ms must be <= max_ms")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmitEnvelope:
     """
     Emission envelope defining allowed emission parameters.
@@ -85,22 +161,32 @@ class EmitEnvelope:
     """
     power_mw_max: float  # Maximum power in milliwatts (≤1.0 for Class 1M)
     duty_cycle_max: float  # Maximum duty cycle (0-100%)
-    t_start: float  # Start time (monotonic)
-    t_end: float  # End time (monotonic)
+    t_start_ns: int  # Start time (monotonic nanoseconds)
+    t_end_ns: int  # End time (monotonic nanoseconds)
     pulse_width_bounds: Optional[PulseWidthBounds] = None
-    
+
     def __post_init__(self):
         """Validate envelope constraints."""
         if self.power_mw_max > 1.0:
             raise ValueError("power_mw_max must be <= 1.0 mW (Class 1M limit)")
         if self.duty_cycle_max < 0 or self.duty_cycle_max > 100:
             raise ValueError("duty_cycle_max must be in range [0, 100]")
-        if self.t_start >= self.t_end:
+        if self.t_start_ns >= self.t_end_ns:
             raise ValueError("t_start must be < t_end")
-    
+
+    @property
+    def t_start(self) -> float:
+        """Start time in monotonic seconds (derived from t_start_ns)."""
+        return self.t_start_ns / 1e9
+
+    @property
+    def t_end(self) -> float:
+        """End time in monotonic seconds (derived from t_end_ns)."""
+        return self.t_end_ns / 1e9
+
     def duration_ms(self) -> float:
         """Get emission duration in milliseconds."""
-        return (self.t_end - self.t_start) * 1000.0
+        return (self.t_end_ns - self.t_start_ns) / 1_000_000
     
     def validate_request(self, requested_power_mw: float, 
                          requested_duty_percent: float,
@@ -133,7 +219,7 @@ class EmitEnvelope:
         return True, ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BudgetEnvelope:
     """
     Budget envelope showing remaining resources.
@@ -180,7 +266,25 @@ class SessionStatusEnvelope:
     config_hash: Optional[str] = None  # Bound configuration hash
     cal_hash: Optional[str] = None  # Bound calibration hash
     constraints: Optional[Dict[str, Any]] = None  # Additional constraints
-    
+    _cached_bytes: Optional[bytes] = field(default=None, init=False, repr=False)
+
+    def render(self) -> bytes:
+        """
+        Serialize to JSON bytes, memoized on the instance.
+
+        Status is immutable between FSM transitions, so repeated polls of
+        the same envelope reuse the rendered body.
+
+        Returns:
+            JSON-encoded status as bytes
+        """
+        if self._cached_bytes is None:
+            if ORJSON_AVAILABLE:
+                self._cached_bytes = orjson.dumps(self.to_dict())
+            else:
+                self._cached_bytes = json.dumps(self.to_dict()).encode('utf-8')
+        return self._cached_bytes
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses."""
         result = {
@@ -6,14 +6,45 @@ side-effect hooks, and fault latching.
 """
 
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, Callable, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, List, Tuple, NamedTuple
 from enum import Enum
 from .context import SessionContext, FSMState, Budget
 from .predicates import PredicateEvaluator
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only empty mapping for transitions that carry no data
+_EMPTY_MAPPING = MappingProxyType({})
+
+
+class TransitionRecord(NamedTuple):
+    """
+    Immutable per-transition record returned from transition calls.
+
+    A slotted tuple instead of a 7-key dict: cheaper to allocate on the
+    per-shot emit path and safe to hand out without defensive copies.
+    get() keeps dict-style access working for existing consumers.
+    """
+    from_state: str
+    to_state: str
+    event: str
+    event_data: Dict[str, Any]
+    predicates: Dict[str, Any]
+    timestamp: float
+    wall_clock: float
+    fault_reason: Optional[str] = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-compatible field access by name."""
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render as a plain dict (for trace payloads and JSON)."""
+        return self._asdict()
+
 
 class FSMEvent(Enum):
     """FSM event enumeration."""
@@ -27,6 +58,12 @@ class FSMEvent(Enum):
     FAULT = "FAULT"
 
 
+# Ordinals for dense dispatch indexing, mirroring FSMState.ord
+for _idx, _member in enumerate(FSMEvent):
+    _member.ord = _idx
+del _idx, _member
+
+
 class FSMError(Exception):
     """FSM operation error."""
     pass
@@ -111,10 +148,40 @@ class FSM:
         (FSMState.EMITTING, FSMEvent.FAULT): (FSMState.FAULT, []),
     }
     
+    # Dense dispatch derived from TRANSITION_TABLE: two list index loads
+    # per transition instead of hashing a (state, event) tuple. Member
+    # ordinals (.ord) index directly; _DISPATCH[state][event] holds the
+    # (to_state, required_predicates) entry or None if illegal, and
+    # _LEGAL_MASK[state] has bit event.ord set for each legal event.
+    _NUM_STATES: int = len(FSMState)
+    _NUM_EVENTS: int = len(FSMEvent)
+    _DISPATCH: List[List[Optional[Tuple[FSMState, List[str]]]]] = [
+        [None] * len(FSMEvent) for _ in range(len(FSMState))
+    ]
+    _LEGAL_MASK: List[int] = [0] * len(FSMState)
+    for _key, _entry in TRANSITION_TABLE.items():
+        _DISPATCH[_key[0].ord][_key[1].ord] = _entry
+        _LEGAL_MASK[_key[0].ord] |= 1 << _key[1].ord
+    del _key, _entry
+
+    # Call adapters for predicates whose signature differs from the
+    # plain (context) form: name -> callable(method, context, event_data).
+    # The method argument is resolved live in _evaluate_predicates so
+    # instance overrides keep working; the adapter only shapes arguments,
+    # replacing the per-predicate name-compare cascade with one dict get.
+    _PREDICATE_ADAPTERS: Dict[str, Callable] = {
+        'check_budget_available': lambda m, c, e: m(
+            c, e.get('required_emit_ms', 0.0), e.get('required_duty_percent', 0.0)
+        ),
+        # Hash checks are called separately for drift detection
+        'check_config_hash_match': lambda m, c, e: (True, {}),
+        'check_cal_hash_match': lambda m, c, e: (True, {}),
+    }
+
     def __init__(self, context: SessionContext, trace_writer: Optional[Callable] = None):
         """
         Initialize FSM.
-        
+
         Args:
             context: Session context
             trace_writer: Optional callback function to write trace records
@@ -123,6 +190,23 @@ class FSM:
         self.trace_writer = trace_writer
         self.predicate_evaluator = PredicateEvaluator()
         self._side_effect_hooks: Dict[str, List[Callable]] = {}
+        # Serializes transitions across threads; reentrant because the
+        # fault path and side-effect hooks can transition while held
+        self._lock = threading.RLock()
+
+        # Resolve every predicate named in TRANSITION_TABLE once, failing
+        # fast here rather than mid-transition if a name is stale. The
+        # dict replaces per-transition getattr string lookups; instance
+        # overrides installed later are still picked up live.
+        self._pred_methods: Dict[str, Callable] = {}
+        for _, required_predicates in self.TRANSITION_TABLE.values():
+            for pred_name in required_predicates:
+                if pred_name in self._pred_methods:
+                    continue
+                pred_method = getattr(self.predicate_evaluator, pred_name, None)
+                if pred_method is None:
+                    raise FSMError(f"Unknown predicate in TRANSITION_TABLE: {pred_name}")
+                self._pred_methods[pred_name] = pred_method
     
     def add_side_effect_hook(self, event: str, hook: Callable[[FSMState, FSMState, Dict], None]):
         """
@@ -132,11 +216,12 @@ class FSM:
             event: Event name or state transition identifier
             hook: Function(state_from, state_to, transition_data) -> None
         """
-        if event not in self._side_effect_hooks:
-            self._side_effect_hooks[event] = []
-        self._side_effect_hooks[event].append(hook)
+        with self._lock:
+            if event not in self._side_effect_hooks:
+                self._side_effect_hooks[event] = []
+            self._side_effect_hooks[event].append(hook)
     
-    def transition(self, event: FSMEvent, event_data: Optional[Dict[str, Any]] = None) -> Tuple[bool, str, Dict[str, Any]]:
+    def transition(self, event: FSMEvent, event_data: Optional[Dict[str, Any]] = None) -> Tuple[bool, str, TransitionRecord]:
         """
         Attempt state transition.
         
@@ -150,145 +235,312 @@ class FSM:
         Raises:
             FSMError: If transition is illegal or predicates fail
         """
-        if event_data is None:
-            event_data = {}
-        
-        from_state = self.context.state
-        transition_key = (from_state, event)
-        
-        # Check if transition is legal
-        if transition_key not in self.TRANSITION_TABLE:
-            error_msg = f"Illegal transition: {from_state.value} --{event.value}--> ?"
-            logger.error(error_msg)
-            raise FSMError(error_msg)
-        
-        to_state, required_predicates = self.TRANSITION_TABLE[transition_key]
-        
-        # Evaluate all required predicates
-        predicate_results = {}
+        # Freeze event_data: hooks, trace records, and the background
+        # trace thread all see one read-only view, so nothing downstream
+        # needs a defensive copy
+        event_data = MappingProxyType(dict(event_data) if event_data else {})
+
+        with self._lock:
+            # One clock read per transition, shared by trace record and side
+            # effects; closely-spaced events within a transition carry the
+            # same timestamp.
+            ts_mono = time.monotonic()
+            ts_wall = time.time()
+            # Predicates read the tick clock from the context so every
+            # guard in this transition sees the same instant
+            self.context.tick_monotonic = ts_mono
+
+            from_state = self.context.state
+            entry = self._DISPATCH[from_state.ord][event.ord]
+
+            # Check if transition is legal
+            if entry is None:
+                error_msg = f"Illegal transition: {from_state.value} --{event.value}--> ?"
+                logger.error(error_msg)
+                raise FSMError(error_msg)
+
+            to_state, required_predicates = entry
+
+            # STOP/EMIT_COMPLETE/FAULT/RESET entries carry no predicates;
+            # skip evaluation and result bookkeeping entirely for them
+            if not required_predicates:
+                return self._execute_transition(from_state, to_state, event, event_data,
+                                                _EMPTY_MAPPING, ts_mono, ts_wall)
+
+            # Evaluate all required predicates
+            all_predicates_pass, predicate_results = self._evaluate_predicates(
+                required_predicates, event_data
+            )
+
+            # If predicates fail, transition to FAULT (except if already in FAULT or going to SAFE)
+            if not all_predicates_pass and to_state != FSMState.SAFE:
+                logger.error("Predicate failures, transitioning to FAULT: %s", predicate_results)
+                fault_reason = f"Predicate failures: {[k for k, v in predicate_results.items() if not v.get('passed', False)]}"
+                return self._transition_to_fault(fault_reason, predicate_results, ts_mono, ts_wall)
+
+            # Execute transition
+            return self._execute_transition(from_state, to_state, event, event_data,
+                                            predicate_results, ts_mono, ts_wall)
+
+    def _evaluate_predicates(self, required_predicates: List[str],
+                             event_data: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Evaluate guard predicates for a transition.
+
+        Args:
+            required_predicates: Predicate method names to evaluate
+            event_data: Event-specific data (budget requirements etc.)
+
+        Returns:
+            (all_passed, predicate_results)
+        """
+        # Per-predicate result dicts only matter when they reach a trace
+        # record or a fault reason; with no trace writer attached, the
+        # all-pass path skips building them entirely and failures
+        # allocate lazily on first occurrence.
+        predicate_results: Optional[Dict[str, Any]] = {} if self.trace_writer is not None else None
         all_predicates_pass = True
-        
+        # Bind hot lookups once; the loop body then runs on locals only
+        evaluator_overrides = self.predicate_evaluator.__dict__
+        pred_methods = self._pred_methods
+        adapters = self._PREDICATE_ADAPTERS
+        context = self.context
+
         for pred_name in required_predicates:
-            pred_method = getattr(self.predicate_evaluator, pred_name, None)
+            # Instance override first (live, so replaced doubles are
+            # seen), then the methods resolved at __init__. Every table
+            # name was validated at construction, so no missing-method
+            # branch is needed here.
+            pred_method = evaluator_overrides.get(pred_name)
             if pred_method is None:
-                logger.error(f"Predicate method not found: {pred_name}")
-                all_predicates_pass = False
-                predicate_results[pred_name] = {
-                    "passed": False,
-                    "error": "predicate_method_not_found"
-                }
-                continue
-            
+                pred_method = pred_methods[pred_name]
+
             try:
-                # Handle predicates that need additional arguments
-                if pred_name == 'check_budget_available':
-                    required_emit_ms = event_data.get('required_emit_ms', 0.0)
-                    required_duty_percent = event_data.get('required_duty_percent', 0.0)
-                    passed, bounds = pred_method(self.context, required_emit_ms, required_duty_percent)
-                elif pred_name in ['check_config_hash_match', 'check_cal_hash_match']:
-                    # These will be called separately for drift detection
-                    passed, bounds = True, {}  # Skip for now, handled in drift detection
+                # Adapter shapes arguments for predicates with extra
+                # parameters; the common case is a plain (context) call
+                adapter = adapters.get(pred_name)
+                if adapter is not None:
+                    passed, bounds = adapter(pred_method, context, event_data)
                 else:
-                    passed, bounds = pred_method(self.context)
-                
-                predicate_results[pred_name] = {
-                    "passed": passed,
-                    "bounds": bounds
-                }
-                
+                    passed, bounds = pred_method(context)
+
                 if not passed:
                     all_predicates_pass = False
-                    logger.warning(f"Predicate failed: {pred_name}, bounds: {bounds}")
-            
+                    if predicate_results is None:
+                        predicate_results = {}
+                    logger.warning("Predicate failed: %s, bounds: %s", pred_name, bounds)
+                if predicate_results is not None:
+                    predicate_results[pred_name] = {
+                        "passed": passed,
+                        "bounds": bounds
+                    }
+
             except Exception as e:
-                logger.error(f"Predicate evaluation error for {pred_name}: {e}")
+                logger.error("Predicate evaluation error for %s: %s", pred_name, e)
                 all_predicates_pass = False
+                if predicate_results is None:
+                    predicate_results = {}
                 predicate_results[pred_name] = {
                     "passed": False,
                     "error": str(e)
                 }
-        
-        # If predicates fail, transition to FAULT (except if already in FAULT or going to SAFE)
-        if not all_predicates_pass and to_state != FSMState.SAFE:
-            logger.error(f"Predicate failures, transitioning to FAULT: {predicate_results}")
-            fault_reason = f"Predicate failures: {[k for k, v in predicate_results.items() if not v.get('passed', False)]}"
-            return self._transition_to_fault(fault_reason, predicate_results)
-        
-        # Execute transition
-        return self._execute_transition(from_state, to_state, event, event_data, predicate_results)
-    
-    def _execute_transition(self, from_state: FSMState, to_state: FSMState, 
+
+        return all_predicates_pass, (predicate_results if predicate_results is not None else {})
+
+    def emit_atomic(self, pattern_fn: Callable[[], bool],
+                    event_data: Optional[Dict[str, Any]] = None) -> Tuple[bool, str, Optional[TransitionRecord]]:
+        """
+        Run a full emit cycle (EMIT_READY → EMITTING → EMIT_READY) in one call.
+
+        Fuses EMIT_REQUEST and EMIT_COMPLETE: guards are evaluated once,
+        pattern_fn runs while EMITTING, and the completion trace record
+        carries the pattern result, so callers do not need a separate
+        result record.
+
+        Args:
+            pattern_fn: Callable performing the emission; returns True on success
+            event_data: Event-specific data (budget requirements etc.)
+
+        Returns:
+            (pattern_success, message, completion_transition_info);
+            transition_info is None when a concurrent transition (e.g. a
+            latched FAULT) pre-empted the completion
+
+        Raises:
+            FSMError: If the emit transition is illegal from the current state
+        """
+        event_data = MappingProxyType(dict(event_data) if event_data else {})
+
+        # Guards and the entry transition run under the lock; pattern_fn
+        # itself runs unlocked so a concurrent FAULT is not blocked for
+        # the duration of the emission
+        with self._lock:
+            ts_mono = time.monotonic()
+            ts_wall = time.time()
+            self.context.tick_monotonic = ts_mono
+
+            from_state = self.context.state
+            entry = self._DISPATCH[from_state.ord][FSMEvent.EMIT_REQUEST.ord]
+
+            if entry is None:
+                error_msg = f"Illegal transition: {from_state.value} --{FSMEvent.EMIT_REQUEST.value}--> ?"
+                logger.error(error_msg)
+                raise FSMError(error_msg)
+
+            to_state, required_predicates = entry
+
+            all_predicates_pass, predicate_results = self._evaluate_predicates(
+                required_predicates, event_data
+            )
+
+            if not all_predicates_pass:
+                logger.error("Predicate failures, transitioning to FAULT: %s", predicate_results)
+                fault_reason = f"Predicate failures: {[k for k, v in predicate_results.items() if not v.get('passed', False)]}"
+                success, message, transition_info = self._transition_to_fault(
+                    fault_reason, predicate_results, ts_mono, ts_wall
+                )
+                return False, message, transition_info
+
+            success, message, transition_info = self._execute_transition(
+                from_state, to_state, FSMEvent.EMIT_REQUEST, event_data,
+                predicate_results, ts_mono, ts_wall
+            )
+            if not success or self.context.state != FSMState.EMITTING:
+                return False, message, transition_info
+
+        pattern_success = False
+        try:
+            pattern_success = bool(pattern_fn())
+        finally:
+            with self._lock:
+                # pattern_fn ran unlocked, so another thread may have
+                # moved the FSM (typically latching FAULT). Writing the
+                # completion then would overwrite that state and append
+                # a fabricated EMITTING -> EMIT_READY record; re-check
+                # the live state and only complete if we still own it.
+                live_state = self.context.state
+                if live_state is FSMState.EMITTING:
+                    completion_data = dict(event_data)
+                    completion_data['pattern_success'] = pattern_success
+                    completion_data = MappingProxyType(completion_data)
+                    success, message, transition_info = self._execute_transition(
+                        FSMState.EMITTING, FSMState.EMIT_READY,
+                        FSMEvent.EMIT_COMPLETE, completion_data, _EMPTY_MAPPING
+                    )
+                else:
+                    success = False
+                    transition_info = None
+                    message = f"Emission pre-empted: state changed to {live_state.value}"
+                    if self.context.fault_reason:
+                        message = f"{message} ({self.context.fault_reason})"
+                    logger.error("Emit completion skipped: %s", message)
+
+        return pattern_success and success, message, transition_info
+
+    def _execute_transition(self, from_state: FSMState, to_state: FSMState,
                            event: FSMEvent, event_data: Dict[str, Any],
-                           predicate_results: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
+                           predicate_results: Dict[str, Any],
+                           ts_mono: Optional[float] = None,
+                           ts_wall: Optional[float] = None) -> Tuple[bool, str, TransitionRecord]:
         """
         Execute state transition with side effects.
-        
+
         Returns:
             (success, message, transition_info)
         """
+        if ts_mono is None:
+            ts_mono = time.monotonic()
+        if ts_wall is None:
+            ts_wall = time.time()
         try:
             # Update context state
             self.context.state = to_state
-            
+
             # Execute state-specific side effects
-            self._execute_side_effects(from_state, to_state, event, event_data)
-            
+            self._execute_side_effects(from_state, to_state, event, event_data, ts_mono)
+
             # Write trace record
-            transition_info = {
-                "from_state": from_state.value,
-                "to_state": to_state.value,
-                "event": event.value,
-                "event_data": event_data,
-                "predicates": predicate_results,
-                "timestamp": time.monotonic(),
-                "wall_clock": time.time()
-            }
+            transition_info = TransitionRecord(
+                from_state=from_state.value,
+                to_state=to_state.value,
+                event=event.value,
+                event_data=event_data,
+                predicates=predicate_results if type(predicate_results) is MappingProxyType
+                           else MappingProxyType(predicate_results),
+                timestamp=ts_mono,
+                wall_clock=ts_wall
+            )
             
             if self.trace_writer:
                 try:
                     self.trace_writer(transition_info)
                 except Exception as e:
-                    logger.error(f"Trace writer error: {e}")
+                    logger.error("Trace writer error: %s", e)
             
-            logger.info(f"State transition: {from_state.value} --{event.value}--> {to_state.value}")
+            logger.info("State transition: %s --%s--> %s", from_state.value, event.value, to_state.value)
             
             return True, f"Transitioned {from_state.value} -> {to_state.value}", transition_info
         
         except Exception as e:
-            logger.error(f"Transition execution error: {e}")
+            logger.error("Transition execution error: %s", e)
             # Transition to FAULT on execution error
             return self._transition_to_fault(f"Transition execution error: {str(e)}", {})
-    
+
+    def _enter_initialized(self, event_data: Dict[str, Any], ts_mono: float):
+        """INITIALIZED: initialize budget from config."""
+        if self.context.config:
+            self.context.initialize_budget(self.context.config)
+
+    def _enter_armed(self, event_data: Dict[str, Any], ts_mono: float):
+        """ARMED: start arming window."""
+        self.context.start_arming_window()
+
+    def _enter_emit_ready(self, event_data: Dict[str, Any], ts_mono: float):
+        """EMIT_READY: clear arming window."""
+        self.context.clear_arming_window()
+
+    def _enter_emitting(self, event_data: Dict[str, Any], ts_mono: float):
+        """EMITTING: consume budget (if provided in event_data)."""
+        if not self.context.budget:
+            return
+        emit_duration_ms = event_data.get('emit_duration_ms', 0.0)
+        duty_percent = event_data.get('duty_percent', 0.0)
+
+        if emit_duration_ms > 0:
+            self.context.budget.consume_emit_time(emit_duration_ms)
+        if duty_percent > 0:
+            self.context.budget.consume_duty_cycle(duty_percent)
+
+    def _on_emit_complete(self, event_data: Dict[str, Any], ts_mono: float):
+        """EMIT_COMPLETE: record emission end for cooldown."""
+        if self.context.budget:
+            self.context.budget.record_emit_end(ts_mono)
+
+    # Action tables: entry actions keyed by target state, event actions
+    # keyed by event. A dict lookup replaces the per-transition if-chain.
+    _ENTRY_ACTIONS: Dict[FSMState, Callable] = {
+        FSMState.INITIALIZED: _enter_initialized,
+        FSMState.ARMED: _enter_armed,
+        FSMState.EMIT_READY: _enter_emit_ready,
+        FSMState.EMITTING: _enter_emitting,
+    }
+
+    _EVENT_ACTIONS: Dict[FSMEvent, Callable] = {
+        FSMEvent.EMIT_COMPLETE: _on_emit_complete,
+    }
+
     def _execute_side_effects(self, from_state: FSMState, to_state: FSMState,
-                               event: FSMEvent, event_data: Dict[str, Any]):
+                               event: FSMEvent, event_data: Dict[str, Any],
+                               ts_mono: float):
         """Execute side effects for state transitions."""
-        
-        # INITIALIZED: Initialize budget
-        if to_state == FSMState.INITIALIZED and self.context.config:
-            self.context.initialize_budget(self.context.config)
-        
-        # ARMED: Start arming window
-        if to_state == FSMState.ARMED:
-            self.context.start_arming_window()
-        
-        # EMIT_READY: Clear arming window
-        if to_state == FSMState.EMIT_READY:
-            self.context.clear_arming_window()
-        
-        # EMITTING: Consume budget (if provided in event_data)
-        if to_state == FSMState.EMITTING and self.context.budget:
-            emit_duration_ms = event_data.get('emit_duration_ms', 0.0)
-            duty_percent = event_data.get('duty_percent', 0.0)
-            
-            if emit_duration_ms > 0:
-                self.context.budget.consume_emit_time(emit_duration_ms)
-            if duty_percent > 0:
-                self.context.budget.consume_duty_cycle(duty_percent)
-        
-        # EMIT_COMPLETE: Record emission end for cooldown
-        if event == FSMEvent.EMIT_COMPLETE and self.context.budget:
-            self.context.budget.record_emit_end(time.monotonic())
-        
+        entry_action = self._ENTRY_ACTIONS.get(to_state)
+        if entry_action is not None:
+            entry_action(self, event_data, ts_mono)
+
+        event_action = self._EVENT_ACTIONS.get(event)
+        if event_action is not None:
+            event_action(self, event_data, ts_mono)
+
         # Call registered hooks
         hook_key = f"{from_state.value}->{to_state.value}"
         if hook_key in self._side_effect_hooks:
@@ -296,43 +548,52 @@ class FSM:
                 try:
                     hook(from_state, to_state, event_data)
                 except Exception as e:
-                    logger.error(f"Side effect hook error: {e}")
+                    logger.error("Side effect hook error: %s", e)
     
-    def _transition_to_fault(self, reason: str, predicate_results: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
+    def _transition_to_fault(self, reason: str, predicate_results: Dict[str, Any],
+                             ts_mono: Optional[float] = None,
+                             ts_wall: Optional[float] = None) -> Tuple[bool, str, TransitionRecord]:
         """
         Transition to FAULT state.
-        
+
         Args:
             reason: Reason for fault
             predicate_results: Predicate evaluation results
-            
+
         Returns:
             (success, message, transition_info)
         """
-        from_state = self.context.state
-        to_state = FSMState.FAULT
-        
-        self.context.state = to_state
-        self.context.fault_reason = reason
-        
-        transition_info = {
-            "from_state": from_state.value,
-            "to_state": to_state.value,
-            "event": FSMEvent.FAULT.value,
-            "fault_reason": reason,
-            "predicates": predicate_results,
-            "timestamp": time.monotonic(),
-            "wall_clock": time.time()
-        }
-        
-        if self.trace_writer:
-            try:
-                self.trace_writer(transition_info)
-            except Exception as e:
-                logger.error(f"Trace writer error: {e}")
-        
-        logger.error(f"FAULT transition: {reason}")
-        
+        if ts_mono is None:
+            ts_mono = time.monotonic()
+        if ts_wall is None:
+            ts_wall = time.time()
+
+        with self._lock:
+            from_state = self.context.state
+            to_state = FSMState.FAULT
+
+            self.context.state = to_state
+            self.context.fault_reason = reason
+
+            transition_info = TransitionRecord(
+                from_state=from_state.value,
+                to_state=to_state.value,
+                event=FSMEvent.FAULT.value,
+                event_data=_EMPTY_MAPPING,
+                predicates=MappingProxyType(predicate_results),
+                timestamp=ts_mono,
+                wall_clock=ts_wall,
+                fault_reason=reason
+            )
+
+            if self.trace_writer:
+                try:
+                    self.trace_writer(transition_info)
+                except Exception as e:
+                    logger.error("Trace writer error: %s", e)
+
+        logger.error("FAULT transition: %s", reason)
+
         return True, f"Fault: {reason}", transition_info
     
     def get_state(self) -> FSMState:
@@ -349,6 +610,6 @@ class FSM:
         Returns:
             True if transition is legal
         """
-        transition_key = (self.context.state, event)
-        return transition_key in self.TRANSITION_TABLE
+        mask = self._LEGAL_MASK[self.context.state.ord]
+        return bool((mask >> event.ord) & 1)
 
@@ -5,6 +5,7 @@ Pure functions evaluating all guard conditions for FSM transitions.
 Returns boolean results and numeric bounds for envelope computation.
 """
 
+import functools
 import time
 import logging
 from typing import Dict, Any, Tuple, Optional
@@ -12,6 +13,63 @@ from .context import SessionContext, FSMState
 
 logger = logging.getLogger(__name__)
 
+# HealthStatus values compared in the health-check loop, hoisted so the
+# loop compares against locals-bound str constants rather than touching
+# the Enum descriptor each iteration
+_STATUS_CRITICAL = "critical"
+_STATUS_ERROR = "error"
+
+# Config sections every session must carry
+_REQUIRED_SECTIONS = frozenset({'hardware', 'safety'})
+
+
+def _requires(**fields):
+    """
+    Declare context attributes a predicate needs to be non-None.
+
+    Keyword arguments map attribute name -> error token for the bounds
+    dict when that attribute is missing, so every predicate keeps its
+    established error vocabulary while the None-guard boilerplate lives
+    in one place. Predicates with simulation-mode fallbacks keep their
+    guards inline, since absence is legal for them.
+    """
+    items = tuple(fields.items())
+
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(context: SessionContext, *args, **kwargs):
+            for name, error in items:
+                if getattr(context, name) is None:
+                    return False, {"error": error}
+            return fn(context, *args, **kwargs)
+        return wrapper
+    return deco
+
+
+def _memo_by_version(fn):
+    """
+    Memoize a predicate on the context's version counter.
+
+    The context clears its predicate cache whenever version bumps, so a
+    hit is always computed from the current config/calibration. Only
+    predicates that read nothing but versioned context fields may use
+    this — anything touching hardware, health monitors, or the clock
+    must stay uncached.
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(context: SessionContext) -> Tuple[bool, Dict[str, Any]]:
+        cache = context._predicate_cache
+        hit = cache.get(name)
+        if hit is not None:
+            return hit
+        result = fn(context)
+        cache[name] = result
+        return result
+
+    return wrapper
+
 
 class PredicateEvaluator:
     """
@@ -22,6 +80,8 @@ class PredicateEvaluator:
     """
     
     @staticmethod
+    @_memo_by_version
+    @_requires(config="config_not_loaded", config_hash="config_hash_not_computed")
     def check_config_valid(context: SessionContext) -> Tuple[bool, Dict[str, Any]]:
         """
         Check if configuration is valid and loaded.
@@ -29,21 +89,17 @@ class PredicateEvaluator:
         Returns:
             (is_valid, bounds_dict)
         """
-        if context.config is None:
-            return False, {"error": "config_not_loaded"}
-        
-        if context.config_hash is None:
-            return False, {"error": "config_hash_not_computed"}
-        
-        # Check required sections
-        required_sections = ['hardware', 'safety']
-        for section in required_sections:
-            if section not in context.config:
-                return False, {"error": f"missing_section_{section}"}
-        
+        # One C-level set difference instead of per-section membership
+        # tests; min() keeps the reported section deterministic
+        missing = _REQUIRED_SECTIONS.difference(context.config)
+        if missing:
+            return False, {"error": f"missing_section_{min(missing)}"}
+
         return True, {"config_hash": context.config_hash}
     
     @staticmethod
+    @_memo_by_version
+    @_requires(calibration="calibration_not_loaded", cal_hash="cal_hash_not_computed")
     def check_calibration_valid(context: SessionContext) -> Tuple[bool, Dict[str, Any]]:
         """
         Check if calibration is valid and loaded.
@@ -51,12 +107,6 @@ class PredicateEvaluator:
         Returns:
             (is_valid, bounds_dict)
         """
-        if context.calibration is None:
-            return False, {"error": "calibration_not_loaded"}
-        
-        if context.cal_hash is None:
-            return False, {"error": "cal_hash_not_computed"}
-        
         # Check calibration has points
         points = context.calibration.get('points', [])
         if not points or len(points) < 2:
@@ -65,6 +115,7 @@ class PredicateEvaluator:
         return True, {"cal_hash": context.cal_hash, "points": len(points)}
     
     @staticmethod
+    @_requires(health_monitor="health_monitor_not_available")
     def check_dependencies_ok(context: SessionContext) -> Tuple[bool, Dict[str, Any]]:
         """
         Check if all dependencies are available.
@@ -72,9 +123,6 @@ class PredicateEvaluator:
         Returns:
             (is_valid, bounds_dict)
         """
-        if context.health_monitor is None:
-            return False, {"error": "health_monitor_not_available"}
-        
         try:
             check = context.health_monitor.check_dependencies()
             is_ok = check.status.value == "healthy"
@@ -125,6 +173,7 @@ class PredicateEvaluator:
         return True, {"faults": 0}
     
     @staticmethod
+    @_requires(budget="budget_not_initialized")
     def check_cooldown_satisfied(context: SessionContext) -> Tuple[bool, Dict[str, Any]]:
         """
         Check if cooldown period is satisfied.
@@ -132,14 +181,11 @@ class PredicateEvaluator:
         Returns:
             (cooldown_satisfied, bounds_dict with remaining_ms)
         """
-        if context.budget is None:
-            return False, {"error": "budget_not_initialized"}
-        
-        config = context.config or {}
-        safety = config.get('safety', {})
-        cooldown_time_ms = safety.get('cooldown_time', 60.0) * 1000.0
-        
-        current_time = time.monotonic()
+        cooldown_time_ms = context._settings.cooldown_time_ms
+
+        current_time = context.tick_monotonic
+        if current_time is None:
+            current_time = time.monotonic()
         context.budget.update_cooldown(current_time, cooldown_time_ms)
         
         is_satisfied = context.budget.cooldown_remaining_ms <= 0.0
@@ -151,6 +197,7 @@ class PredicateEvaluator:
         }
     
     @staticmethod
+    @_requires(arming_window_start="arming_window_not_started")
     def check_arm_confirmation_within_window(context: SessionContext) -> Tuple[bool, Dict[str, Any]]:
         """
         Check if arm confirmation is within the arming window.
@@ -158,12 +205,13 @@ class PredicateEvaluator:
         Returns:
             (within_window, bounds_dict)
         """
-        is_valid = context.is_arming_window_valid()
-        
-        if context.arming_window_start is None:
-            return False, {"error": "arming_window_not_started"}
-        
-        elapsed_ms = (time.monotonic() - context.arming_window_start) * 1000.0
+        now = context.tick_monotonic
+        if now is None:
+            now = time.monotonic()
+
+        is_valid = context.is_arming_window_valid(now)
+
+        elapsed_ms = (now - context.arming_window_start) * 1000.0
         remaining_ms = max(0.0, context.arming_window_duration_ms - elapsed_ms)
         
         return is_valid, {
@@ -174,6 +222,7 @@ class PredicateEvaluator:
         }
     
     @staticmethod
+    @_requires(budget="budget_not_initialized")
     def check_budget_available(context: SessionContext, 
                               required_emit_ms: float = 0.0,
                               required_duty_percent: float = 0.0) -> Tuple[bool, Dict[str, Any]]:
@@ -188,29 +237,39 @@ class PredicateEvaluator:
         Returns:
             (budget_available, bounds_dict with remaining budgets)
         """
-        if context.budget is None:
-            return False, {"error": "budget_not_initialized"}
-        
-        has_emit_time = context.budget.remaining_emit_ms >= required_emit_ms
-        has_duty_cycle = context.budget.remaining_duty_percent >= required_duty_percent
-        
+        budget = context.budget
+
+        # Bind the float fields once; the compares and the bounds dict
+        # below otherwise each repeat the context.budget attribute chain
+        remaining_emit_ms = budget.remaining_emit_ms
+        remaining_duty_percent = budget.remaining_duty_percent
+
+        has_emit_time = remaining_emit_ms >= required_emit_ms
+        has_duty_cycle = remaining_duty_percent >= required_duty_percent
+
         budget_available = has_emit_time and has_duty_cycle
-        
+
         return budget_available, {
             "budget_available": budget_available,
-            "remaining_emit_ms": context.budget.remaining_emit_ms,
+            "remaining_emit_ms": remaining_emit_ms,
             "required_emit_ms": required_emit_ms,
-            "remaining_duty_percent": context.budget.remaining_duty_percent,
+            "remaining_duty_percent": remaining_duty_percent,
             "required_duty_percent": required_duty_percent,
             "has_emit_time": has_emit_time,
             "has_duty_cycle": has_duty_cycle
         }
     
     @staticmethod
-    def check_hardware_health(context: SessionContext) -> Tuple[bool, Dict[str, Any]]:
+    def check_hardware_health(context: SessionContext,
+                              verbose: bool = False) -> Tuple[bool, Dict[str, Any]]:
         """
         Check hardware health status.
-        
+
+        Args:
+            verbose: Include per-check name/status/message detail in the
+                bounds dict. Guard evaluation leaves this off; the health
+                endpoints expose full detail separately.
+
         Returns:
             (is_healthy, bounds_dict)
         """
@@ -224,19 +283,28 @@ class PredicateEvaluator:
             checks = context.health_monitor.run_all_checks(
                 context.photodiode_reader,
                 context.laser_controller,
-                context.config.get('logging', {}).get('log_dir', 'logs') if context.config else 'logs'
+                context._settings.log_dir
             )
             
-            # Check for critical or error status
-            has_critical = any(c.status.value == "critical" for c in checks)
-            has_error = any(c.status.value == "error" for c in checks)
+            # Single pass over the checks: one .status.value load per
+            # check instead of one per any() scan
+            has_critical = False
+            has_error = False
+            for c in checks:
+                s = c.status.value
+                if s == _STATUS_CRITICAL:
+                    has_critical = True
+                elif s == _STATUS_ERROR:
+                    has_error = True
             is_healthy = not (has_critical or has_error)
-            
-            return is_healthy, {
+
+            bounds = {
                 "hardware_healthy": is_healthy,
                 "has_critical": has_critical,
                 "has_error": has_error,
-                "checks": [
+            }
+            if verbose:
+                bounds["checks"] = [
                     {
                         "name": c.name,
                         "status": c.status.value,
@@ -244,7 +312,7 @@ class PredicateEvaluator:
                     }
                     for c in checks
                 ]
-            }
+            return is_healthy, bounds
         except Exception as e:
             logger.error(f"Hardware health check failed: {e}")
             return False, {"error": str(e)}
@@ -10,7 +10,11 @@ Collects and writes session artifacts on shutdown:
 - session_manifest.json (root hash, session metadata, versions)
 """
 
+import functools
 import json
+import os
+import platform
+import sys
 import time
 import logging
 from pathlib import Path
@@ -18,32 +22,89 @@ from typing import Dict, Any, Optional
 from .trace import TraceWriter
 from .context import SessionContext
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Interpreter/platform identification is immutable for the process;
+# capture it once instead of per manifest
+_VERSIONS = {
+    "python": sys.version,
+    "platform": platform.platform(),
+}
+
+
+def _write_json_file(path: Path, obj: Dict[str, Any], pretty: bool = False):
+    """
+    Write a bundle artifact as sorted JSON, compact by default.
+
+    Uses orjson's single-pass encoder (bytes straight to disk) when
+    available; stdlib json otherwise. Compact form halves file size and
+    encode time for large config/calibration snapshots; pass pretty=True
+    for indented, human-readable output when debugging.
+
+    Each artifact goes to a temp name, is fsynced, then renamed into
+    place with os.replace, so a crash mid-shutdown leaves either the
+    previous file or a complete new one — never a truncated snapshot.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(obj, option=option)
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        # Wide buffer coalesces json.dump's many small .write() calls
+        with open(tmp, 'w', buffering=1 << 20) as f:
+            if pretty:
+                json.dump(obj, f, indent=2, sort_keys=True)
+            else:
+                json.dump(obj, f, sort_keys=True, separators=(',', ':'))
+            f.write('\n')
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
 
 class SessionBundle:
     """
     Session bundle writer for operational closure artifacts.
     """
     
-    def __init__(self, session_dir: Path, context: SessionContext, trace_writer: TraceWriter):
+    def __init__(self, session_dir: Path, context: SessionContext, trace_writer: TraceWriter,
+                 pretty: bool = False):
         """
         Initialize session bundle.
-        
+
         Args:
             session_dir: Directory for session artifacts
             context: Session context
             trace_writer: Trace writer instance
+            pretty: Write indented JSON artifacts instead of compact
         """
         self.session_dir = session_dir
         self.context = context
         self.trace_writer = trace_writer
+        self.pretty = pretty
         self.health_start: Optional[Dict[str, Any]] = None
         self.health_end: Optional[Dict[str, Any]] = None
         
         # Ensure directory exists
         self.session_dir.mkdir(parents=True, exist_ok=True)
-    
+
+    @functools.cached_property
+    def session_dir_str(self) -> str:
+        """Stringified session directory, cached for status responses."""
+        return str(self.session_dir)
+
     def set_health_start(self, health_data: Dict[str, Any]):
         """
         Set initial health check data.
@@ -70,7 +131,17 @@ class SessionBundle:
             Path to session directory
         """
         logger.info(f"Writing session bundle to {self.session_dir}")
-        
+
+        # One clock read and one strftime for the whole bundle; every
+        # snapshot written below belongs to the same shutdown instant
+        self._now = time.time()
+        self._now_ns = time.time_ns()
+        self._now_iso = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(self._now))
+
+        # Make sure any queued trace records are on disk before bundling
+        if hasattr(self.trace_writer, 'flush'):
+            self.trace_writer.flush()
+
         # Write trace (already exists, just verify)
         trace_file = self.session_dir / "trace.jsonl"
         if not trace_file.exists() and self.trace_writer.trace_file.exists():
@@ -84,11 +155,10 @@ class SessionBundle:
             config_snapshot = {
                 "config": self.context.config,
                 "config_hash": self.context.config_hash,
-                "timestamp": time.time(),
-                "timestamp_iso": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+                "timestamp_ns": self._now_ns,
+                "timestamp_iso": self._now_iso
             }
-            with open(config_file, 'w') as f:
-                json.dump(config_snapshot, f, indent=2, sort_keys=True)
+            _write_json_file(config_file, config_snapshot, self.pretty)
             logger.info(f"Wrote config snapshot: {config_file}")
         
         # Write calibration snapshot
@@ -97,31 +167,27 @@ class SessionBundle:
             cal_snapshot = {
                 "calibration": self.context.calibration,
                 "cal_hash": self.context.cal_hash,
-                "timestamp": time.time(),
-                "timestamp_iso": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+                "timestamp_ns": self._now_ns,
+                "timestamp_iso": self._now_iso
             }
-            with open(cal_file, 'w') as f:
-                json.dump(cal_snapshot, f, indent=2, sort_keys=True)
+            _write_json_file(cal_file, cal_snapshot, self.pretty)
             logger.info(f"Wrote calibration snapshot: {cal_file}")
         
         # Write health snapshots
         if self.health_start is not None:
             health_start_file = self.session_dir / "health_start.json"
-            with open(health_start_file, 'w') as f:
-                json.dump(self.health_start, f, indent=2, sort_keys=True)
+            _write_json_file(health_start_file, self.health_start, self.pretty)
             logger.info(f"Wrote health start snapshot: {health_start_file}")
         
         if self.health_end is not None:
             health_end_file = self.session_dir / "health_end.json"
-            with open(health_end_file, 'w') as f:
-                json.dump(self.health_end, f, indent=2, sort_keys=True)
+            _write_json_file(health_end_file, self.health_end, self.pretty)
             logger.info(f"Wrote health end snapshot: {health_end_file}")
         
         # Write session manifest
         manifest = self._create_manifest()
         manifest_file = self.session_dir / "session_manifest.json"
-        with open(manifest_file, 'w') as f:
-            json.dump(manifest, f, indent=2, sort_keys=True)
+        _write_json_file(manifest_file, manifest, self.pretty)
         logger.info(f"Wrote session manifest: {manifest_file}")
         
         logger.info(f"Session bundle complete: {self.session_dir}")
@@ -138,7 +204,7 @@ class SessionBundle:
         # Compute root hash
         session_metadata = {
             "session_id": self.context.session_id,
-            "state": self.context.state.value,
+            "state": self.context.state_str,
             "config_hash": self.context.config_hash,
             "cal_hash": self.context.cal_hash,
             "simulation_mode": self.context.simulation_mode,
@@ -146,25 +212,18 @@ class SessionBundle:
         }
         
         root_hash = self.trace_writer.get_root_hash(session_metadata)
-        
-        # Get system info
-        import sys
-        import platform
-        
+
         manifest = {
             "session_id": self.context.session_id,
             "root_hash": root_hash,
-            "created": time.time(),
-            "created_iso": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()),
-            "state": self.context.state.value,
+            "created": self._now,
+            "created_iso": self._now_iso,
+            "state": self.context.state_str,
             "config_hash": self.context.config_hash,
             "cal_hash": self.context.cal_hash,
             "simulation_mode": self.context.simulation_mode,
             "fault_reason": self.context.fault_reason,
-            "versions": {
-                "python": sys.version,
-                "platform": platform.platform(),
-            },
+            "versions": _VERSIONS,
             "files": {
                 "trace": "trace.jsonl",
                 "config": "config.json" if self.context.config else None,
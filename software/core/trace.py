@@ -5,17 +5,65 @@ Hash-chained append-only event log for FSM transitions and events.
 Provides tamper detection through hash chaining.
 """
 
+import atexit
+import concurrent.futures
 import json
+import os
+import sys
+import queue
+import threading
 import time
 import hashlib
 import logging
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from enum import Enum
+from types import MappingProxyType
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_default(obj):
+    """Encode read-only mapping views (MappingProxyType) as plain dicts."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_loads(data):
+    """Parse a JSON line with orjson when available, stdlib otherwise."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _canonical_encode(obj: Dict[str, Any]) -> bytes:
+    """
+    Encode object as canonical JSON bytes (sorted keys, compact separators).
+
+    Uses orjson when available. Writer and verifier both go through this
+    helper, so a chain always verifies with the encoder that is present;
+    the encoders only diverge on exponent-notation floats, which trace
+    records do not contain.
+
+    Args:
+        obj: Dictionary to serialize
+
+    Returns:
+        Canonical JSON as UTF-8 bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=_encode_default)
+    return json.dumps(obj, sort_keys=True, separators=(',', ':'),
+                      ensure_ascii=False, default=_encode_default).encode('utf-8')
+
+
 class EventType(Enum):
     """Trace event type enumeration."""
     STATE_TRANSITION = "STATE_TRANSITION"
@@ -26,36 +74,88 @@ class EventType(Enum):
     CONFIG_DRIFT = "CONFIG_DRIFT"
 
 
+# Interned event-type strings, one dict lookup instead of the Enum
+# .value descriptor chain on every record write
+_EVENT_TYPE_VALUE = {et: sys.intern(et.value) for et in EventType}
+
+# Sentinel prev_hash for the first record of a chain (64 hex chars,
+# SHA256-width); built once instead of per record
+_ZERO_HASH = "0" * 64
+
+
 class TraceWriter:
     """
     Hash-chained append-only trace writer.
-    
+
     Each record contains a hash of the previous record, creating
     an immutable chain that can detect tampering.
+
+    In buffered mode the writer is a single-producer/single-consumer
+    pipeline: write_record serialises and extends the hash chain
+    synchronously on the caller thread, queues the finished line, and a
+    background thread coalesces queued lines into one vectored append
+    per batch. Chain integrity never depends on the deferred I/O; only
+    durability does, which flush() (called from SessionBundle and the
+    fault path) restores on demand.
     """
     
-    def __init__(self, trace_file: Path, session_id: str):
+    def __init__(self, trace_file: Path, session_id: str, buffered: bool = False,
+                 batch_size: int = 64, batch_window_s: float = 0.01,
+                 dsync: bool = False):
         """
         Initialize trace writer.
-        
+
         Args:
             trace_file: Path to trace JSONL file
             session_id: Session identifier
+            buffered: If True, file appends happen on a background thread
+                in batches instead of one syscall per record. The hash
+                chain is still computed synchronously; only the disk
+                write is deferred. Call flush() before reading the file.
+            batch_size: Maximum records coalesced into one write when buffered
+            batch_window_s: How long the background writer waits for more
+                records to join a batch before submitting it
+            dsync: If True (and the platform supports O_DSYNC), each
+                append is durable before the write returns
         """
         self.trace_file = trace_file
         self.session_id = session_id
         self.sequence = 0
         self.prev_hash: Optional[str] = None
-        
+        self.buffered = buffered
+        self.batch_size = batch_size
+        self.batch_window_s = batch_window_s
+        self._write_queue: Optional['queue.Queue'] = None
+        self._writer_thread: Optional[threading.Thread] = None
+
         # Ensure directory exists
         self.trace_file.parent.mkdir(parents=True, exist_ok=True)
-        
+
         # Initialize trace file if it doesn't exist
         if not self.trace_file.exists():
             self._write_header()
         else:
             # Load existing trace to get last hash
             self._load_last_hash()
+
+        # Pin one append-mode fd for the writer's lifetime; every record
+        # is a single os.write instead of an open/write/close cycle.
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        if dsync and hasattr(os, 'O_DSYNC'):
+            flags |= os.O_DSYNC
+        self._fd: Optional[int] = os.open(self.trace_file, flags, 0o644)
+
+        if self.buffered:
+            self._write_queue = queue.Queue()
+            self._writer_thread = threading.Thread(
+                target=self._drain_queue,
+                name=f"trace-writer-{session_id[:8]}",
+                daemon=True
+            )
+            self._writer_thread.start()
+            # The writer thread is a daemon, so an exit that skips
+            # close() would drop queued records; drain them at exit.
+            atexit.register(self.flush)
     
     def _write_header(self):
         """Write trace file header."""
@@ -72,50 +172,64 @@ class TraceWriter:
         logger.info(f"Initialized trace file: {self.trace_file}")
     
     def _load_last_hash(self):
-        """Load the last record hash from existing trace file."""
+        """
+        Load the last record hash from an existing trace file.
+
+        Scans backwards from the end in fixed-size blocks (the classic
+        tail algorithm), so resuming onto a long-running trace costs one
+        small read and O(1) memory instead of slurping the whole file.
+        """
         try:
-            with open(self.trace_file, 'r') as f:
-                lines = f.readlines()
-                # Skip header, find last record
-                for line in reversed(lines[1:]):
-                    if line.strip():
+            with open(self.trace_file, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                buf = b''
+                while size > 0:
+                    n = min(4096, size)
+                    size -= n
+                    f.seek(size)
+                    buf = f.read(n) + buf
+                    lines = buf.split(b'\n')
+                    # lines[0] is a partial line unless we reached the
+                    # start of the file; retry it with the next block
+                    complete = lines if size == 0 else lines[1:]
+                    for line in reversed(complete):
+                        line = line.strip()
+                        if not line:
+                            continue
                         try:
-                            record = json.loads(line)
-                            if 'hash' in record:
-                                self.prev_hash = record['hash']
-                                # Get sequence number
-                                self.sequence = record.get('seq', 0)
-                                break
-                        except json.JSONDecodeError:
+                            record = _json_loads(line)
+                        except ValueError:
                             continue
+                        # The header line carries no hash, so it can
+                        # never match here
+                        if 'hash' in record:
+                            self.prev_hash = record['hash']
+                            self.sequence = record.get('seq', 0)
+                            return
+                    buf = lines[0] if size > 0 else b''
         except Exception as e:
             logger.warning(f"Could not load last hash: {e}")
             self.prev_hash = None
             self.sequence = 0
     
-    def _canonical_json(self, obj: Dict[str, Any]) -> str:
-        """
-        Convert object to canonical JSON string (deterministic).
-        
-        Args:
-            obj: Dictionary to serialize
-            
-        Returns:
-            Canonical JSON string
-        """
-        return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
-    
-    def _compute_hash(self, data: str) -> str:
+    def _compute_hash(self, data) -> str:
         """
         Compute SHA256 hash of data.
-        
+
+        Bytes pass straight to the C digest core; str input is encoded
+        first. Integrity fingerprint, not a credential, hence
+        usedforsecurity=False.
+
         Args:
-            data: String data to hash
-            
+            data: String or bytes data to hash
+
         Returns:
             Hexadecimal hash string
         """
-        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return hashlib.sha256(data, usedforsecurity=False).hexdigest()
     
     def write_record(self, event_type: EventType, state_from: Optional[str] = None,
                     state_to: Optional[str] = None, predicates: Optional[Dict[str, Any]] = None,
@@ -138,14 +252,19 @@ class TraceWriter:
             Written record dictionary
         """
         self.sequence += 1
-        
-        # Build record (without hash field)
+
+        # Build record (without hash field). A pooled per-writer scratch
+        # dict was rejected: the record escapes as this method's return
+        # value, so reuse would hand every caller the same mutating
+        # dict. Likewise the encoded line must stay immutable bytes —
+        # in buffered mode the writer thread still holds it after
+        # write_record returns.
         record = {
             "ts": time.monotonic(),
             "wall_clock": time.time(),
             "seq": self.sequence,
-            "prev_hash": self.prev_hash or "0" * 64,  # 64 hex chars for SHA256
-            "event_type": event_type.value,
+            "prev_hash": self.prev_hash or _ZERO_HASH,
+            "event_type": _EVENT_TYPE_VALUE.get(event_type, event_type),
             "session_id": self.session_id,
         }
         
@@ -162,24 +281,102 @@ class TraceWriter:
         if cal_hash is not None:
             record["cal_hash"] = cal_hash
         
-        # Compute hash of canonical record (without hash field)
-        canonical = self._canonical_json(record)
-        record_hash = self._compute_hash(canonical)
-        
+        # Compute hash of canonical record (without hash field). One C-level
+        # pass: orjson emits the bytes, sha256 consumes them. Feeding the
+        # digest per-field would change the chain formula and orphan every
+        # existing trace for no gain over the single-buffer update.
+        #
+        # A fixed-key-order template (hand-built byte fragments instead of
+        # sort_keys) was considered and rejected: the chain formula hashes
+        # the canonical encoding of the whole record, so nested predicates
+        # and event_data dicts must be key-sorted regardless, and orjson
+        # performs that sort in C where it is not the bottleneck. The
+        # None-valued optional keys are already skipped above.
+        payload = _canonical_encode(record)
+        record_hash = hashlib.sha256(payload, usedforsecurity=False).hexdigest()
+
         # Add hash to record
         record["hash"] = record_hash
-        
-        # Write to file (append mode)
-        with open(self.trace_file, 'a') as f:
-            f.write(json.dumps(record, sort_keys=True) + '\n')
-        
+
+        # Splice the hash into the already-encoded payload rather than
+        # re-serialising the whole record; the verifier parses JSON and
+        # re-canonicalises, so the hash key's position does not matter
+        line = payload[:-1] + b',"hash":"' + record_hash.encode('ascii') + b'"}\n'
+        if self.buffered:
+            self._write_queue.put(line)
+        else:
+            os.write(self._fd, line)
+
         # Update previous hash for next record
         self.prev_hash = record_hash
         
         logger.debug(f"Trace record written: seq={self.sequence}, hash={record_hash[:16]}...")
         
         return record
-    
+
+    def _submit_batch(self, batch: List[bytes]):
+        """Write a batch of record lines with one syscall."""
+        try:
+            if hasattr(os, 'writev'):
+                # Vectored submission: no intermediate join copy
+                os.writev(self._fd, batch)
+            else:
+                os.write(self._fd, b''.join(batch))
+        except OSError as e:
+            logger.error(f"Trace write failed: {e}")
+
+    def _drain_queue(self):
+        """Background writer: coalesce queued records into batched appends."""
+        try:
+            # Only this thread touches the batch list, so one allocation
+            # is reused across every batch instead of a fresh list each
+            batch: List[bytes] = []
+            while True:
+                first = self._write_queue.get()
+                if first is None:
+                    self._write_queue.task_done()
+                    break
+                batch.clear()
+                batch.append(first)
+                # Wait up to batch_window_s for more records to coalesce,
+                # so bursty transitions share one submission
+                deadline = time.monotonic() + self.batch_window_s
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._write_queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        # Put the shutdown sentinel back for the next loop
+                        self._write_queue.put(None)
+                        break
+                    batch.append(item)
+                self._submit_batch(batch)
+                for _ in batch:
+                    self._write_queue.task_done()
+        except Exception as e:
+            logger.error(f"Trace writer thread exiting: {e}")
+
+    def flush(self):
+        """Block until all queued records are on disk (no-op when unbuffered)."""
+        if self.buffered and self._write_queue is not None:
+            self._write_queue.join()
+
+    def close(self):
+        """Flush pending records, stop the background writer, release the fd."""
+        if self.buffered and self._writer_thread is not None:
+            self.flush()
+            self._write_queue.put(None)
+            self._writer_thread.join(timeout=5.0)
+            self._writer_thread = None
+            self.buffered = False
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
     def get_root_hash(self, session_metadata: Optional[Dict[str, Any]] = None) -> str:
         """
         Compute session root hash.
@@ -192,18 +389,42 @@ class TraceWriter:
         """
         if self.prev_hash is None:
             # No records yet
-            return "0" * 64
+            return _ZERO_HASH
         
-        # Root hash = last record hash + session metadata hash
+        # Root hash = sha256(last record hash hex || metadata hash hex).
+        # Fed to the digest incrementally so no 128-char concatenation
+        # string is built. The hex-based formula itself is kept: it is
+        # what existing session manifests were produced with, and
+        # switching to raw 32-byte digests would silently change every
+        # future root hash for the same trace content.
         if session_metadata:
-            metadata_hash = self._compute_hash(self._canonical_json(session_metadata))
-            # Combine hashes
-            combined = self.prev_hash + metadata_hash
-            return self._compute_hash(combined)
+            metadata_hash = hashlib.sha256(_canonical_encode(session_metadata),
+                                           usedforsecurity=False).hexdigest()
+            combined = hashlib.sha256(usedforsecurity=False)
+            combined.update(self.prev_hash.encode('ascii'))
+            combined.update(metadata_hash.encode('ascii'))
+            return combined.hexdigest()
         else:
             return self.prev_hash
 
 
+# Below this record count, process-pool spawn and pickling cost more
+# than the hashing they parallelise
+_PARALLEL_VERIFY_MIN = 4096
+
+
+def _recompute_record_hash(record: Dict[str, Any]) -> str:
+    """
+    Recompute a record's content hash from its non-hash fields.
+
+    Module-level (not a method) so ProcessPoolExecutor workers can
+    pickle it for parallel chain verification.
+    """
+    record_without_hash = {k: v for k, v in record.items() if k != 'hash'}
+    return hashlib.sha256(_canonical_encode(record_without_hash),
+                          usedforsecurity=False).hexdigest()
+
+
 class TraceReader:
     """
     Trace reader for verification and analysis.
@@ -212,33 +433,50 @@ class TraceReader:
     def __init__(self, trace_file: Path):
         """
         Initialize trace reader.
-        
+
+        Records are parsed lazily: scans iterate the file line by line
+        in O(1) memory, and the full list is only materialised (and then
+        cached) when a caller actually asks for it.
+
         Args:
             trace_file: Path to trace JSONL file
         """
         self.trace_file = trace_file
-        self.records: List[Dict[str, Any]] = []
-        self._load_records()
-    
-    def _load_records(self):
-        """Load all records from trace file."""
+        self._records: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """All parsed records, materialised on first access."""
+        return self.get_records()
+
+    def iter_records(self):
+        """
+        Yield parsed records one line at a time.
+
+        Streams the file so filters over large traces never hold more
+        than one record in memory; use get_records() when the whole
+        list is genuinely needed.
+        """
         if not self.trace_file.exists():
             logger.warning(f"Trace file not found: {self.trace_file}")
             return
-        
+
         try:
-            with open(self.trace_file, 'r') as f:
-                lines = f.readlines()
-                # Skip header (first line)
-                for line in lines[1:]:
-                    if line.strip():
-                        try:
-                            record = json.loads(line)
-                            self.records.append(record)
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse trace record: {e}")
+            with open(self.trace_file, 'rb') as f:
+                next(f, None)  # Skip header (first line)
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield _json_loads(line)
+                    except ValueError as e:
+                        logger.warning(f"Failed to parse trace record: {e}")
         except Exception as e:
             logger.error(f"Failed to load trace records: {e}")
+
+    def _scan(self):
+        """Cheapest record source: the cached list if present, else a stream."""
+        return self._records if self._records is not None else self.iter_records()
     
     def verify_chain(self) -> tuple[bool, List[str]]:
         """
@@ -248,43 +486,54 @@ class TraceReader:
             (is_valid, list_of_errors)
         """
         errors = []
-        
-        if not self.records:
-            return True, []
-        
+
+        # Pass 1 (sequential, cheap): prev_hash links, streamed from
+        # disk unless the record list is already cached. Also collect
+        # the records whose content hashes need recomputing.
         prev_hash = None
-        
-        for i, record in enumerate(self.records):
+        to_check = []
+
+        for i, record in enumerate(self._scan()):
             seq = record.get('seq', i + 1)
-            
+
             # Check prev_hash matches
             record_prev_hash = record.get('prev_hash')
             if prev_hash is not None and record_prev_hash != prev_hash:
                 errors.append(f"Record {seq}: prev_hash mismatch (expected {prev_hash[:16]}..., got {record_prev_hash[:16]}...)")
-            
-            # Verify hash
+
             record_hash = record.get('hash')
             if record_hash:
-                # Recompute hash (without hash field)
-                record_without_hash = {k: v for k, v in record.items() if k != 'hash'}
-                canonical = json.dumps(record_without_hash, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
-                computed_hash = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
-                
-                if computed_hash != record_hash:
-                    errors.append(f"Record {seq}: hash mismatch (computed {computed_hash[:16]}..., stored {record_hash[:16]}...)")
-            
+                to_check.append((seq, record))
+
             prev_hash = record_hash
-        
+
+        # Pass 2: per-record hash recomputation. Independent once the
+        # links are checked, so large traces fan out across cores.
+        record_iter = (r for _, r in to_check)
+        if len(to_check) >= _PARALLEL_VERIFY_MIN:
+            with concurrent.futures.ProcessPoolExecutor() as ex:
+                computed_hashes = list(ex.map(_recompute_record_hash, record_iter,
+                                              chunksize=256))
+        else:
+            computed_hashes = [_recompute_record_hash(r) for r in record_iter]
+
+        for (seq, record), computed_hash in zip(to_check, computed_hashes):
+            if computed_hash != record['hash']:
+                errors.append(f"Record {seq}: hash mismatch (computed {computed_hash[:16]}..., stored {record['hash'][:16]}...)")
+
         return len(errors) == 0, errors
     
     def get_records(self) -> List[Dict[str, Any]]:
-        """Get all loaded records."""
-        return self.records
-    
+        """Get all records as a list (parsed once, then cached)."""
+        if self._records is None:
+            self._records = list(self.iter_records())
+        return self._records
+
     def get_state_transitions(self) -> List[Dict[str, Any]]:
         """Get all state transition records."""
+        st = _EVENT_TYPE_VALUE[EventType.STATE_TRANSITION]
         return [
-            r for r in self.records
-            if r.get('event_type') == EventType.STATE_TRANSITION.value
+            r for r in self._scan()
+            if r.get('event_type') == st
         ]
 
@@ -5,13 +5,28 @@ Streamlit-based GUI for EUV detection and laser communication device.
 """
 
 import streamlit as st
-import time
+import json
 import yaml
+from dataclasses import dataclass
 import numpy as np
 import plotly.graph_objects as go
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Prefer the libyaml C loader when available; it is much faster than the
+# pure-Python SafeLoader for multi-KB configs (same pattern as
+# core.hash_binding)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -27,6 +42,85 @@ st.set_page_config(
     layout="wide"
 )
 
+def _make_history_fig(trace_name, color, title, y_title):
+    """
+    Build a history figure shell with its layout locked in.
+
+    The shell lives in session_state; refresh ticks only swap the
+    trace's y data instead of rebuilding the figure and re-sending the
+    layout to the browser each time.
+    """
+    fig = go.Figure(go.Scatter(
+        y=[],
+        mode='lines+markers',
+        name=trace_name,
+        line=dict(color=color)
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title="Measurement",
+        yaxis_title=y_title,
+        height=300
+    )
+    return fig
+
+
+# Cap on points shipped to the browser per trace; full-precision data
+# stays in the SignalProcessor ring buffer for analytics
+_MAX_PLOT_POINTS = 500
+
+
+def _lttb(arr, n_out=_MAX_PLOT_POINTS):
+    """
+    Downsample a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the visually significant points (peaks, inflections) so a
+    history of any length renders as at most n_out markers, bounding the
+    Plotly JSON encode and the browser's SVG work regardless of how high
+    the user sets history_length. Arrays already at or under the cap are
+    returned unchanged.
+
+    Args:
+        arr: 1-D NumPy array of y values (x assumed uniformly spaced)
+        n_out: Maximum number of points to keep
+
+    Returns:
+        Downsampled array of length n_out (same dtype), or arr itself
+    """
+    n = arr.shape[0]
+    if n <= n_out or n_out < 3:
+        return arr
+
+    y = arr.astype(np.float64, copy=False)
+    x = np.arange(n, dtype=np.float64)
+
+    # First and last points are always kept; the interior is split into
+    # n_out - 2 buckets and the largest-triangle point of each survives
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0] = 0
+    idx[-1] = n - 1
+
+    ax, ay = 0.0, y[0]
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i < n_out - 3:
+            # Point C: centroid of the following bucket
+            cx = x[hi:edges[i + 2]].mean()
+            cy = y[hi:edges[i + 2]].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        # Vectorised triangle areas for every candidate B in the bucket
+        bx = x[lo:hi]
+        by = y[lo:hi]
+        areas = np.abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))
+        j = lo + int(areas.argmax())
+        idx[i + 1] = j
+        ax, ay = x[j], y[j]
+
+    return arr[idx]
+
+
 # Initialize session state
 if 'photodiode_reader' not in st.session_state:
     st.session_state.photodiode_reader = None
@@ -42,16 +136,42 @@ if 'health_monitor' not in st.session_state:
     st.session_state.health_monitor = SystemHealthMonitor()
 if 'last_health_check' not in st.session_state:
     st.session_state.last_health_check = None
+if 'last_wl_plotted' not in st.session_state:
+    st.session_state.last_wl_plotted = None
+if 'last_v_plotted' not in st.session_state:
+    st.session_state.last_v_plotted = None
+if 'wl_fig' not in st.session_state:
+    st.session_state.wl_fig = _make_history_fig(
+        'Wavelength (nm)', 'blue', "Wavelength History", "Wavelength (nm)")
+if 'v_fig' not in st.session_state:
+    st.session_state.v_fig = _make_history_fig(
+        'Voltage (V)', 'green', "Voltage History", "Voltage (V)")
 
 # Load configuration
-@st.cache_data
+@st.cache_resource
 def load_config():
-    """Load device configuration."""
+    """
+    Load device configuration.
+
+    cache_resource (not cache_data) shares the parsed dict across
+    sessions without re-pickling it on every widget interaction. Cold
+    parses go through the libyaml C loader and mirror the result to a
+    JSON sidecar keyed by the YAML mtime, so later cold starts parse
+    JSON instead of YAML and skip re-validation until the file changes.
+    """
     config_path = Path(__file__).parent.parent / "config" / "device_config.yaml"
     if config_path.exists():
         try:
+            sidecar = config_path.with_name(config_path.name + '.cache.json')
+            try:
+                if sidecar.exists() and sidecar.stat().st_mtime >= config_path.stat().st_mtime:
+                    data = sidecar.read_bytes()
+                    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            except Exception:
+                pass  # Stale or unreadable sidecar; fall through to YAML
+
             with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
             
             # Validate configuration
             is_valid, errors = validate_config(str(config_path))
@@ -60,6 +180,14 @@ def load_config():
                 for error in errors:
                     st.warning(f"  - {error}")
             
+            try:
+                sidecar.write_bytes(
+                    orjson.dumps(config) if ORJSON_AVAILABLE
+                    else json.dumps(config).encode('utf-8')
+                )
+            except OSError:
+                pass  # The sidecar is purely an optimisation
+            
             return config
         except Exception as e:
             st.error(f"Failed to load configuration: {e}")
@@ -70,33 +198,120 @@ def load_config():
 
 config = load_config()
 
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """
+    Flattened, typed view of the GUI-relevant config values.
+
+    Built once per run from the raw config dict so the script body does
+    attribute loads instead of re-walking nested .get() chains (and
+    allocating their empty-dict defaults) on every rerun.
+    """
+    i2c_address: int = 0x48
+    adc_channel: int = 0
+    gain: int = 1
+    sample_rate: int = 250
+    laser_pin: int = 18
+    interlock_pin: int = 23
+    pwm_frequency: int = 1000
+    pulse_duration: float = 0.001
+    log_dir: str = 'logs'
+    auto_start_session: bool = True
+    update_rate: float = 1.0
+    history_length: int = 100
+    encoding_pulse_duration: float = 0.1
+    encoding_gap_duration: float = 0.1
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> 'AppConfig':
+        """Extract the GUI's settings from the nested config dict."""
+        hardware = raw.get('hardware', {})
+        photodiode = hardware.get('photodiode', {})
+        laser = hardware.get('laser', {})
+        log_cfg = raw.get('logging', {})
+        prefs = raw.get('preferences', {})
+        encoding = raw.get('signal_processing', {}).get('encoding', {})
+        return cls(
+            i2c_address=photodiode.get('i2c_address', 0x48),
+            adc_channel=photodiode.get('adc_channel', 0),
+            gain=photodiode.get('gain', 1),
+            sample_rate=photodiode.get('sample_rate', 250),
+            laser_pin=laser.get('laser_pin', 18),
+            interlock_pin=laser.get('interlock_pin', 23),
+            pwm_frequency=laser.get('pwm_frequency', 1000),
+            pulse_duration=laser.get('pulse_duration', 0.001),
+            log_dir=log_cfg.get('log_dir', 'logs'),
+            auto_start_session=log_cfg.get('auto_start_session', True),
+            update_rate=prefs.get('update_rate', 1.0),
+            history_length=prefs.get('history_length', 100),
+            encoding_pulse_duration=encoding.get('pulse_duration', 0.1),
+            encoding_gap_duration=encoding.get('gap_duration', 0.1),
+        )
+
+
+cfg = AppConfig.from_dict(config or {})
+
+# Hardware factories. cache_resource makes each a process-wide
+# singleton keyed by its config arguments: new tabs and reruns reuse
+# the existing instance instead of re-opening I2C/GPIO handles, and a
+# config edit changes the key, which transparently builds fresh ones.
+@st.cache_resource
+def get_photodiode_reader(i2c_address, adc_channel, gain, sample_rate):
+    """Construct (or reuse) the process-wide photodiode reader."""
+    return PhotodiodeReader(
+        i2c_address=i2c_address,
+        adc_channel=adc_channel,
+        gain=gain,
+        sample_rate=sample_rate
+    )
+
+
+@st.cache_resource
+def get_laser_controller(laser_pin, interlock_pin, pwm_frequency, pulse_duration):
+    """Construct (or reuse) the process-wide laser controller."""
+    return LaserController(
+        laser_pin=laser_pin,
+        interlock_pin=interlock_pin,
+        pwm_frequency=pwm_frequency,
+        pulse_duration=pulse_duration
+    )
+
+
+@st.cache_resource
+def get_signal_processor(log_dir, auto_start_session):
+    """Construct (or reuse) the process-wide signal processor."""
+    processor = SignalProcessor(log_dir=log_dir)
+    if auto_start_session:
+        processor.start_logging_session()
+    return processor
+
+
 # Initialize hardware (with error handling)
 def initialize_hardware():
-    """Initialize hardware components."""
+    """Initialize hardware components via the shared factories."""
     try:
         if st.session_state.photodiode_reader is None:
-            photodiode_config = config.get('hardware', {}).get('photodiode', {})
-            st.session_state.photodiode_reader = PhotodiodeReader(
-                i2c_address=photodiode_config.get('i2c_address', 0x48),
-                adc_channel=photodiode_config.get('adc_channel', 0),
-                gain=photodiode_config.get('gain', 1),
-                sample_rate=photodiode_config.get('sample_rate', 250)
+            st.session_state.photodiode_reader = get_photodiode_reader(
+                cfg.i2c_address,
+                cfg.adc_channel,
+                cfg.gain,
+                cfg.sample_rate
             )
         
         if st.session_state.laser_controller is None:
-            laser_config = config.get('hardware', {}).get('laser', {})
-            st.session_state.laser_controller = LaserController(
-                laser_pin=laser_config.get('laser_pin', 18),
-                interlock_pin=laser_config.get('interlock_pin', 23),
-                pwm_frequency=laser_config.get('pwm_frequency', 1000),
-                pulse_duration=laser_config.get('pulse_duration', 0.001)
+            st.session_state.laser_controller = get_laser_controller(
+                cfg.laser_pin,
+                cfg.interlock_pin,
+                cfg.pwm_frequency,
+                cfg.pulse_duration
             )
         
         if st.session_state.signal_processor is None:
-            log_dir = config.get('logging', {}).get('log_dir', 'logs')
-            st.session_state.signal_processor = SignalProcessor(log_dir=log_dir)
-            if config.get('logging', {}).get('auto_start_session', True):
-                st.session_state.signal_processor.start_logging_session()
+            st.session_state.signal_processor = get_signal_processor(
+                cfg.log_dir,
+                cfg.auto_start_session
+            )
         
         return True
     except Exception as e:
@@ -147,7 +362,7 @@ with st.sidebar:
             checks = st.session_state.health_monitor.run_all_checks(
                 st.session_state.photodiode_reader,
                 st.session_state.laser_controller,
-                config.get('logging', {}).get('log_dir', 'logs')
+                cfg.log_dir
             )
             st.session_state.last_health_check = checks
     
@@ -192,98 +407,102 @@ col1, col2 = st.columns([2, 1])
 
 with col1:
     st.header("Wavelength Measurement")
+
+    # Fragment with its own timer: live updates redraw only this
+    # subtree instead of re-executing the whole script (config load,
+    # sidebar, laser UI) once per sample. Idle (not measuring) leaves
+    # the timer off; Start/Stop trigger app reruns that re-arm it.
+    @st.fragment(
+        run_every=cfg.update_rate if st.session_state.measurement_running else None
+    )
+    def _measurement_section():
+        """Measurement controls, live metrics, and history plots."""
+        # Measurement controls
+        col1a, col1b, col1c = st.columns(3)
+        with col1a:
+            if st.button("Start Measurement", disabled=st.session_state.measurement_running):
+                st.session_state.measurement_running = True
+                st.rerun()
     
-    # Measurement controls
-    col1a, col1b, col1c = st.columns(3)
-    with col1a:
-        if st.button("Start Measurement", disabled=st.session_state.measurement_running):
-            st.session_state.measurement_running = True
-            st.rerun()
-    
-    with col1b:
-        if st.button("Stop Measurement", disabled=not st.session_state.measurement_running):
-            st.session_state.measurement_running = False
-            st.rerun()
+        with col1b:
+            if st.button("Stop Measurement", disabled=not st.session_state.measurement_running):
+                st.session_state.measurement_running = False
+                st.rerun()
     
-    with col1c:
-        if st.button("Calibrate Dark"):
-            if st.session_state.photodiode_reader:
-                dark_voltage = st.session_state.photodiode_reader.measure_dark_voltage()
-                st.success(f"Dark voltage: {dark_voltage:.4f} V")
+        with col1c:
+            if st.button("Calibrate Dark"):
+                if st.session_state.photodiode_reader:
+                    dark_voltage = st.session_state.photodiode_reader.measure_dark_voltage()
+                    st.success(f"Dark voltage: {dark_voltage:.4f} V")
     
-    # Current measurement display
-    if st.session_state.photodiode_reader and st.session_state.measurement_running:
-        try:
-            wavelength = st.session_state.photodiode_reader.get_wavelength()
-            voltage = st.session_state.photodiode_reader.get_voltage()
+        # Current measurement display
+        if st.session_state.photodiode_reader and st.session_state.measurement_running:
+            try:
+                # One set of ADC reads per tick; calling get_wavelength
+                # and get_voltage separately doubles the I2C traffic for
+                # what is the same underlying voltage measurement
+                wavelength, voltage = st.session_state.photodiode_reader.read_pair()
             
-            st.session_state.last_measurement = {
-                'wavelength': wavelength,
-                'voltage': voltage
-            }
+                st.session_state.last_measurement = {
+                    'wavelength': wavelength,
+                    'voltage': voltage
+                }
             
-            # Update processor
-            laser_state = "off"
-            if st.session_state.laser_controller:
-                laser_state = st.session_state.laser_controller.get_state().value
+                # Update processor
+                laser_state = "off"
+                if st.session_state.laser_controller:
+                    laser_state = st.session_state.laser_controller.get_state().value
             
-            st.session_state.signal_processor.add_measurement(
-                wavelength, voltage, laser_state
-            )
-        except Exception as e:
-            st.error(f"Measurement error: {e}")
-            st.session_state.measurement_running = False
+                st.session_state.signal_processor.add_measurement(
+                    wavelength, voltage, laser_state
+                )
+            except Exception as e:
+                st.error(f"Measurement error: {e}")
+                st.session_state.measurement_running = False
     
-    # Display current values
-    metric_col1, metric_col2 = st.columns(2)
-    with metric_col1:
-        wavelength_val = st.session_state.last_measurement.get('wavelength')
-        if wavelength_val:
-            st.metric("Wavelength", f"{wavelength_val:.2f} nm")
-        else:
-            st.metric("Wavelength", "N/A")
+        # Display current values
+        metric_col1, metric_col2 = st.columns(2)
+        with metric_col1:
+            wavelength_val = st.session_state.last_measurement.get('wavelength')
+            if wavelength_val:
+                st.metric("Wavelength", f"{wavelength_val:.2f} nm")
+            else:
+                st.metric("Wavelength", "N/A")
     
-    with metric_col2:
-        voltage_val = st.session_state.last_measurement.get('voltage', 0.0)
-        st.metric("Voltage", f"{voltage_val:.4f} V")
+        with metric_col2:
+            voltage_val = st.session_state.last_measurement.get('voltage', 0.0)
+            st.metric("Voltage", f"{voltage_val:.4f} V")
     
-    # Measurement history plot
-    if st.session_state.signal_processor:
-        history_length = config.get('preferences', {}).get('history_length', 100)
-        wavelengths = st.session_state.signal_processor.get_wavelength_history(history_length)
-        voltages = st.session_state.signal_processor.get_voltage_history(history_length)
+        # Measurement history plot
+        if st.session_state.signal_processor:
+            history_length = cfg.history_length
+            # float32 arrays straight from the processor's ring buffers:
+            # Plotly serialises ndarrays through its binary typed-array
+            # path instead of element-by-element JSON, and 4-byte floats
+            # are plenty for nm-to-two-decimals display
+            wavelengths = st.session_state.signal_processor.get_wavelength_history_ndarray(history_length)
+            voltages = st.session_state.signal_processor.get_voltage_history_ndarray(history_length)
         
-        if wavelengths:
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                y=wavelengths,
-                mode='lines+markers',
-                name='Wavelength (nm)',
-                line=dict(color='blue')
-            ))
-            fig.update_layout(
-                title="Wavelength History",
-                xaxis_title="Measurement",
-                yaxis_title="Wavelength (nm)",
-                height=300
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            # Interaction-triggered reruns arrive with the same history;
+            # only re-downsample and touch the figure when a new sample
+            # actually landed. The chart itself must still be emitted
+            # every rerun (Streamlit removes elements that are not), but
+            # an unchanged figure dedups in the forward-message cache.
+            if wavelengths.size:
+                fig = st.session_state.wl_fig
+                if not np.array_equal(wavelengths, st.session_state.last_wl_plotted):
+                    fig.data[0].y = _lttb(wavelengths)
+                    st.session_state.last_wl_plotted = wavelengths
+                st.plotly_chart(fig, use_container_width=True)
         
-        if voltages:
-            fig2 = go.Figure()
-            fig2.add_trace(go.Scatter(
-                y=voltages,
-                mode='lines+markers',
-                name='Voltage (V)',
-                line=dict(color='green')
-            ))
-            fig2.update_layout(
-                title="Voltage History",
-                xaxis_title="Measurement",
-                yaxis_title="Voltage (V)",
-                height=300
-            )
-            st.plotly_chart(fig2, use_container_width=True)
+            if voltages.size:
+                fig2 = st.session_state.v_fig
+                if not np.array_equal(voltages, st.session_state.last_v_plotted):
+                    fig2.data[0].y = _lttb(voltages)
+                    st.session_state.last_v_plotted = voltages
+                st.plotly_chart(fig2, use_container_width=True)
+
+    _measurement_section()
 
 with col2:
     st.header("Laser Control")
@@ -335,8 +554,8 @@ with col2:
             if st.button("Send Message"):
                 if st.session_state.laser_controller and st.session_state.signal_processor:
                     pattern = st.session_state.signal_processor.encode_message(message, pattern_type)
-                    pulse_dur = config.get('signal_processing', {}).get('encoding', {}).get('pulse_duration', 0.1)
-                    gap_dur = config.get('signal_processing', {}).get('encoding', {}).get('gap_duration', 0.1)
+                    pulse_dur = cfg.encoding_pulse_duration
+                    gap_dur = cfg.encoding_gap_duration
                     
                     if st.session_state.laser_controller.send_pattern(pattern, pulse_dur, gap_dur):
                         st.success(f"Message '{message}' sent")
@@ -362,8 +581,8 @@ with col2:
                     # Adjust pattern size
                     pattern = pattern[:size] if len(pattern) >= size else pattern
                     
-                    pulse_dur = config.get('signal_processing', {}).get('encoding', {}).get('pulse_duration', 0.1)
-                    gap_dur = config.get('signal_processing', {}).get('encoding', {}).get('gap_duration', 0.1)
+                    pulse_dur = cfg.encoding_pulse_duration
+                    gap_dur = cfg.encoding_gap_duration
                     
                     if st.session_state.laser_controller.send_pattern(pattern, pulse_dur, gap_dur):
                         st.success(f"Geometric pattern '{geom_type}' sent")
@@ -382,11 +601,6 @@ with col2:
                 else:
                     st.error("Failed to send pulse")
 
-# Auto-refresh for measurements
-if st.session_state.measurement_running:
-    time.sleep(config.get('preferences', {}).get('update_rate', 1.0))
-    st.rerun()
-
 # Footer
 st.divider()
 st.caption("EUV Detection & Laser Communication Device v1.0 | Class 1M Laser | Australian Compliant")
@@ -208,12 +208,13 @@ class LaserController:
                     gap_duration: float = 0.001) -> bool:
         """
         Send a binary pattern (list of on/off states).
-        
+
         Args:
-            pattern: List of booleans (True = on, False = off)
+            pattern: Sequence of booleans (True = on, False = off); a
+                list or a 1-D NumPy bool array
             pulse_duration: Duration of each pulse in seconds
             gap_duration: Duration of gap between pulses in seconds
-            
+
         Returns:
             True if pattern sent, False if interlock prevents operation
         """
@@ -310,14 +310,31 @@ class PhotodiodeReader:
     def get_voltage(self, samples: int = 10) -> float:
         """
         Get current voltage reading.
-        
+
         Args:
             samples: Number of samples to average
-            
+
         Returns:
             Voltage in volts
         """
         return self.measure_voltage(samples)
+
+    def read_pair(self, samples: int = 10) -> Tuple[Optional[float], float]:
+        """
+        Measure voltage and wavelength from a single set of ADC reads.
+
+        Halves bus transactions versus calling get_wavelength() and
+        get_voltage() separately, since the wavelength is derived from
+        the same voltage measurement.
+
+        Args:
+            samples: Number of samples to average
+
+        Returns:
+            Tuple of (wavelength_nm or None, voltage_v)
+        """
+        voltage = self.measure_voltage(samples)
+        return self.calculate_wavelength(voltage), voltage
     
     def calibrate_point(self, wavelength: float, samples: int = 100):
         """
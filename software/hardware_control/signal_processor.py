@@ -7,6 +7,7 @@ and data logging.
 
 import time
 import logging
+from collections import deque
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 import json
@@ -21,22 +22,70 @@ except ImportError:
     logging.warning("NumPy not available. Some features may be limited.")
 
 
+MORSE_DICT = {
+    'A': '.-', 'B': '-...', 'C': '-.-.', 'D': '-..', 'E': '.',
+    'F': '..-.', 'G': '--.', 'H': '....', 'I': '..', 'J': '.---',
+    'K': '-.-', 'L': '.-..', 'M': '--', 'N': '-.', 'O': '---',
+    'P': '.--.', 'Q': '--.-', 'R': '.-.', 'S': '...', 'T': '-',
+    'U': '..-', 'V': '...-', 'W': '.--', 'X': '-..-', 'Y': '-.--',
+    'Z': '--..', '0': '-----', '1': '.----', '2': '..---', '3': '...--',
+    '4': '....-', '5': '.....', '6': '-....', '7': '--...', '8': '---..',
+    '9': '----.', ' ': ' '
+}
+
+# Symbol expansions used when building per-character Morse patterns:
+# dot = pulse + gap, dash = double pulse + gap, space = word gap.
+_MORSE_SYMBOLS = {
+    '.': (True, False),
+    '-': (True, True, False),
+    ' ': (False, False),
+}
+
+
+def _build_morse_patterns() -> Dict[str, Tuple[bool, ...]]:
+    """Expand each Morse character into its full on/off tuple once."""
+    patterns = {}
+    for char, code in MORSE_DICT.items():
+        bits: List[bool] = []
+        for symbol in code:
+            bits.extend(_MORSE_SYMBOLS[symbol])
+        bits.extend((False, False))  # Gap after letter + extra gap
+        patterns[char] = tuple(bits)
+    return patterns
+
+
+# Per-character lookup tables built once at import. Encoding then reduces
+# to a dict fetch and a list.extend per character instead of re-deriving
+# bit strings and Morse symbols on every call.
+_MORSE_PATTERNS = _build_morse_patterns()
+_BYTE_PATTERNS = tuple(
+    tuple(bit == '1' for bit in format(value, '08b')) + (False,)
+    for value in range(256)
+)
+
+
 class PatternEncoder:
     """Pattern encoder for various signal formats."""
-    
+
     @staticmethod
     def encode_binary(message: str, bits_per_char: int = 8) -> List[bool]:
         """
         Encode text message as binary pattern.
-        
+
         Args:
             message: Text message to encode
             bits_per_char: Bits per character (typically 8 for ASCII)
-            
+
         Returns:
             List of booleans (True = on, False = off)
         """
-        pattern = []
+        pattern: List[bool] = []
+        if bits_per_char == 8 and message.isascii():
+            # Common case: one table fetch per character
+            for char in message:
+                pattern.extend(_BYTE_PATTERNS[ord(char)])
+            return pattern
+
         for char in message:
             # Convert to ASCII
             ascii_val = ord(char)
@@ -48,48 +97,24 @@ class PatternEncoder:
             # Add separator
             pattern.append(False)
         return pattern
-    
+
     @staticmethod
     def encode_morse(message: str) -> List[bool]:
         """
         Encode text message as Morse code pattern.
-        
+
         Args:
             message: Text message to encode
-            
+
         Returns:
             List of booleans (True = on, False = off)
         """
-        morse_dict = {
-            'A': '.-', 'B': '-...', 'C': '-.-.', 'D': '-..', 'E': '.',
-            'F': '..-.', 'G': '--.', 'H': '....', 'I': '..', 'J': '.---',
-            'K': '-.-', 'L': '.-..', 'M': '--', 'N': '-.', 'O': '---',
-            'P': '.--.', 'Q': '--.-', 'R': '.-.', 'S': '...', 'T': '-',
-            'U': '..-', 'V': '...-', 'W': '.--', 'X': '-..-', 'Y': '-.--',
-            'Z': '--..', '0': '-----', '1': '.----', '2': '..---', '3': '...--',
-            '4': '....-', '5': '.....', '6': '-....', '7': '--...', '8': '---..',
-            '9': '----.', ' ': ' '
-        }
-        
-        pattern = []
+        pattern: List[bool] = []
         for char in message.upper():
-            if char in morse_dict:
-                code = morse_dict[char]
-                for symbol in code:
-                    if symbol == '.':
-                        pattern.append(True)
-                        pattern.append(False)  # Gap after dot
-                    elif symbol == '-':
-                        pattern.append(True)
-                        pattern.append(True)  # Dash is longer
-                        pattern.append(False)  # Gap after dash
-                    elif symbol == ' ':
-                        pattern.append(False)
-                        pattern.append(False)  # Word gap
-                
-                pattern.append(False)  # Gap after letter
-                pattern.append(False)  # Extra gap
-        
+            char_pattern = _MORSE_PATTERNS.get(char)
+            if char_pattern is not None:
+                pattern.extend(char_pattern)
+
         return pattern
     
     @staticmethod
@@ -354,9 +379,27 @@ class SignalProcessor:
         self.encoder = PatternEncoder()
         self.filter = SignalFilter()
         self.logger = DataLogger(log_dir)
-        
-        self.measurement_history = []
+
         self.max_history = 1000
+        # Bounded deque: O(1) append with automatic eviction, no
+        # periodic O(n) trim copies
+        self.measurement_history = deque(maxlen=self.max_history)
+
+        # SoA ring buffers for the numeric series. History accessors read
+        # these instead of walking the list of dicts, so per-sample cost
+        # is two scalar stores and the memory stays bounded. NaN marks a
+        # missing wavelength reading.
+        if NUMPY_AVAILABLE:
+            self._wl_buf = np.empty(self.max_history, dtype=np.float64)
+            self._v_buf = np.empty(self.max_history, dtype=np.float64)
+            self._ring_head = 0
+            self._ring_count = 0
+
+    def _ring_ordered(self, buf: 'np.ndarray') -> 'np.ndarray':
+        """Return ring buffer contents in insertion order (oldest first)."""
+        if self._ring_count < self.max_history:
+            return buf[:self._ring_head]
+        return np.concatenate((buf[self._ring_head:], buf[:self._ring_head]))
     
     def encode_message(self, message: str, encoding: str = 'morse') -> List[bool]:
         """
@@ -379,6 +422,28 @@ class SignalProcessor:
             logging.warning(f"Unknown encoding: {encoding}, using Morse")
             return self.encoder.encode_morse(message)
     
+    def encode_message_ndarray(self, message: str, encoding: str = 'morse') -> 'np.ndarray':
+        """
+        Encode a message as a boolean NumPy array.
+
+        Same symbols as encode_message, but contiguous in memory so
+        downstream consumers can slice without copying and count pulses
+        vectorized.
+
+        Args:
+            message: Message to encode
+            encoding: Encoding type ('morse', 'binary', 'geometric')
+
+        Returns:
+            Encoded pattern as a bool ndarray
+
+        Raises:
+            RuntimeError: If NumPy is not available
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy required for ndarray pattern encoding")
+        return np.frombuffer(bytes(self.encode_message(message, encoding)), dtype=np.bool_)
+
     def filter_signal(self, data: List[float], filter_type: str = 'moving_average',
                      **kwargs) -> List[float]:
         """
@@ -424,12 +489,15 @@ class SignalProcessor:
             'pattern_sent': pattern_sent
         }
         
+        # maxlen bounds the deque; the oldest entry falls off on append
         self.measurement_history.append(measurement)
-        
-        # Keep only recent measurements
-        if len(self.measurement_history) > self.max_history:
-            self.measurement_history = self.measurement_history[-self.max_history:]
-        
+
+        if NUMPY_AVAILABLE:
+            self._wl_buf[self._ring_head] = np.nan if wavelength is None else wavelength
+            self._v_buf[self._ring_head] = voltage
+            self._ring_head = (self._ring_head + 1) % self.max_history
+            self._ring_count += 1
+
         # Log measurement
         self.logger.log_measurement(wavelength, voltage, laser_state, pattern_sent)
     
@@ -443,7 +511,12 @@ class SignalProcessor:
         Returns:
             List of wavelengths
         """
-        history = self.measurement_history[-count:] if count else self.measurement_history
+        if NUMPY_AVAILABLE:
+            ordered = self._ring_ordered(self._wl_buf)
+            if count:
+                ordered = ordered[-count:]
+            return ordered[~np.isnan(ordered)].tolist()
+        history = list(self.measurement_history)[-count:] if count else self.measurement_history
         return [m['wavelength'] for m in history if m['wavelength'] is not None]
     
     def get_voltage_history(self, count: Optional[int] = None) -> List[float]:
@@ -456,9 +529,57 @@ class SignalProcessor:
         Returns:
             List of voltages
         """
-        history = self.measurement_history[-count:] if count else self.measurement_history
+        if NUMPY_AVAILABLE:
+            ordered = self._ring_ordered(self._v_buf)
+            if count:
+                ordered = ordered[-count:]
+            return ordered.tolist()
+        history = list(self.measurement_history)[-count:] if count else self.measurement_history
         return [m['voltage'] for m in history]
     
+    def get_wavelength_history_ndarray(self, count: Optional[int] = None) -> 'np.ndarray':
+        """
+        Get wavelength history as a float32 NumPy array.
+
+        Suitable for binary serialization (4 bytes per sample) without
+        the per-element boxing of the list-based accessor.
+
+        Args:
+            count: Number of measurements to return (None = all)
+
+        Returns:
+            float32 array of wavelengths (None readings excluded)
+
+        Raises:
+            RuntimeError: If NumPy is not available
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy required for ndarray history access")
+        ordered = self._ring_ordered(self._wl_buf)
+        if count:
+            ordered = ordered[-count:]
+        return ordered[~np.isnan(ordered)].astype(np.float32)
+
+    def get_voltage_history_ndarray(self, count: Optional[int] = None) -> 'np.ndarray':
+        """
+        Get voltage history as a float32 NumPy array.
+
+        Args:
+            count: Number of measurements to return (None = all)
+
+        Returns:
+            float32 array of voltages
+
+        Raises:
+            RuntimeError: If NumPy is not available
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy required for ndarray history access")
+        ordered = self._ring_ordered(self._v_buf)
+        if count:
+            ordered = ordered[-count:]
+        return ordered.astype(np.float32)
+
     def start_logging_session(self, session_name: Optional[str] = None):
         """Start a new logging session."""
         self.logger.start_session(session_name)
@@ -19,15 +19,15 @@ except ImportError:
     NUMPY_AVAILABLE = False
 
 
-class HealthStatus(Enum):
-    """System health status levels."""
+class HealthStatus(str, Enum):
+    """System health status levels (str-based so serializers emit the value directly)."""
     HEALTHY = "healthy"
     WARNING = "warning"
     ERROR = "error"
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheck:
     """Health check result."""
     name: str
@@ -36,6 +36,20 @@ class HealthCheck:
     timestamp: float
     details: Optional[Dict] = None
 
+    def to_dict(self) -> Dict:
+        """
+        Serialize for API responses and session bundles.
+
+        Returns:
+            Dict with the status Enum flattened to its string value
+        """
+        return {
+            "name": self.name,
+            "status": self.status.value,
+            "message": self.message,
+            "details": self.details
+        }
+
 
 class SystemHealthMonitor:
     """
@@ -46,6 +60,7 @@ class SystemHealthMonitor:
         """Initialize health monitor."""
         self.logger = logging.getLogger(__name__)
         self.checks: List[HealthCheck] = []
+        self.checks_serialized: List[Dict] = []
         self.last_check_time: Optional[float] = None
         self.check_interval: float = 5.0  # seconds
         
@@ -231,8 +246,11 @@ class SystemHealthMonitor:
         checks.append(self.check_file_system(log_dir))
         
         self.checks = checks
+        # Resolve enums to strings once per cycle; consumers reuse this
+        # list instead of re-walking the dataclasses per request
+        self.checks_serialized = [check.to_dict() for check in checks]
         self.last_check_time = time.time()
-        
+
         return checks
     
     def get_overall_status(self) -> Tuple[HealthStatus, str]:
@@ -274,15 +292,7 @@ class SystemHealthMonitor:
             "overall_status": overall_status.value,
             "overall_message": overall_message,
             "last_check": self.last_check_time,
-            "checks": [
-                {
-                    "name": check.name,
-                    "status": check.status.value,
-                    "message": check.message,
-                    "details": check.details
-                }
-                for check in self.checks
-            ]
+            "checks": self.checks_serialized
         }
     
     def get_interlock_status(self, laser_controller) -> bool:
@@ -321,15 +331,7 @@ class SystemHealthMonitor:
             return {
                 "overall_status": overall_status.value,
                 "overall_message": overall_message,
-                "checks": [
-                    {
-                        "name": check.name,
-                        "status": check.status.value,
-                        "message": check.message,
-                        "details": check.details
-                    }
-                    for check in checks
-                ],
+                "checks": self.checks_serialized,
                 "is_healthy": overall_status.value in ["healthy", "warning"]
             }
         except Exception as e:
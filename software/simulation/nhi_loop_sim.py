@@ -184,8 +184,9 @@ def run_nhi_loop_simulation() -> bool:
         """Print each FSM transition for legible verification."""
         from_s = transition_info.get("from_state", "?")
         ev = transition_info.get("event", "?")
-        if "fault_reason" in transition_info:
-            print(f"   [trace] {from_s} --{ev}--> FAULT: {transition_info['fault_reason']}")
+        fault_reason = transition_info.get("fault_reason")
+        if fault_reason is not None:
+            print(f"   [trace] {from_s} --{ev}--> FAULT: {fault_reason}")
         else:
             to_state = transition_info.get("to_state", "?")
             print(f"   [trace] {from_s} --{ev}--> {to_state}")
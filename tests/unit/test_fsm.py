@@ -3,6 +3,7 @@ Unit tests for FSM module.
 """
 
 import unittest
+import threading
 import time
 from unittest.mock import Mock, MagicMock
 from core import SessionContext, FSMState, FSM, FSMEvent, FSMError
@@ -86,6 +87,82 @@ class TestFSM(unittest.TestCase):
         self.assertEqual(self.fsm.can_transition(FSMEvent.ARM), False)  # Not in right state
 
 
+class TestEmitAtomic(unittest.TestCase):
+    """Test the fused EMIT_REQUEST + EMIT_COMPLETE emit cycle."""
+
+    def setUp(self):
+        """Set up an FSM in EMIT_READY with passing emit guards."""
+        self.context = SessionContext()
+        self.trace_writer = Mock()
+        self.fsm = FSM(self.context, self.trace_writer)
+        self.context.state = FSMState.EMIT_READY
+        self.fsm.predicate_evaluator.check_budget_available = Mock(return_value=(True, {}))
+        self.fsm.predicate_evaluator.check_interlock_safe = Mock(return_value=(True, {}))
+
+    def test_emit_atomic_success(self):
+        """Test a successful fused cycle writes both trace records."""
+        success, _, info = self.fsm.emit_atomic(lambda: True)
+        self.assertTrue(success)
+        self.assertEqual(self.context.state, FSMState.EMIT_READY)
+        self.assertEqual(self.trace_writer.call_count, 2)
+        completion = self.trace_writer.call_args_list[1][0][0]
+        self.assertEqual(completion.event, FSMEvent.EMIT_COMPLETE.value)
+        self.assertTrue(completion.event_data['pattern_success'])
+        self.assertIs(info, completion)
+
+    def test_emit_atomic_pattern_failure(self):
+        """Test a failed pattern still completes, recording the failure."""
+        success, _, info = self.fsm.emit_atomic(lambda: False)
+        self.assertFalse(success)
+        self.assertEqual(self.context.state, FSMState.EMIT_READY)
+        self.assertFalse(info.event_data['pattern_success'])
+
+    def test_emit_atomic_pattern_exception(self):
+        """Test an exception in pattern_fn still runs the completion."""
+        def boom():
+            raise RuntimeError("driver error")
+
+        with self.assertRaises(RuntimeError):
+            self.fsm.emit_atomic(boom)
+
+        self.assertEqual(self.context.state, FSMState.EMIT_READY)
+        completion = self.trace_writer.call_args_list[1][0][0]
+        self.assertEqual(completion.event, FSMEvent.EMIT_COMPLETE.value)
+        self.assertFalse(completion.event_data['pattern_success'])
+
+    def test_emit_atomic_concurrent_fault_stays_latched(self):
+        """Test a FAULT latched during emission is not overwritten."""
+        emitting = threading.Event()
+        release = threading.Event()
+
+        def pattern_fn():
+            emitting.set()
+            release.wait(timeout=5.0)
+            return True
+
+        result = {}
+
+        def run():
+            result['value'] = self.fsm.emit_atomic(pattern_fn)
+
+        worker = threading.Thread(target=run)
+        worker.start()
+        self.assertTrue(emitting.wait(timeout=5.0))
+
+        # Latch FAULT from this thread while pattern_fn is still running
+        self.fsm.transition(FSMEvent.FAULT)
+        release.set()
+        worker.join(timeout=5.0)
+
+        success, _, info = result['value']
+        self.assertFalse(success)
+        self.assertIsNone(info)
+        self.assertEqual(self.context.state, FSMState.FAULT)
+        # No fabricated completion record on the trace
+        events = [call[0][0].event for call in self.trace_writer.call_args_list]
+        self.assertNotIn(FSMEvent.EMIT_COMPLETE.value, events)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -119,6 +119,20 @@ class TestPredicates(unittest.TestCase):
         passed, bounds = self.evaluator.check_no_outstanding_faults(self.context)
         self.assertFalse(passed)
 
+    def test_config_predicate_memoized_across_transitions(self):
+        """Test config predicate memo survives state changes, not config changes."""
+        self.context.config = {"hardware": {}, "safety": {}}
+        self.context.config_hash = "test_hash"
+
+        first = self.evaluator.check_config_valid(self.context)
+        self.context.state = FSMState.INITIALIZED
+        second = self.evaluator.check_config_valid(self.context)
+        self.assertIs(second, first)  # cache hit across the transition
+
+        # Reassigning config invalidates the memo
+        self.context.config = {"hardware": {}, "safety": {}, "logging": {}}
+        self.assertEqual(len(self.context._predicate_cache), 0)
+
 
 if __name__ == '__main__':
     unittest.main()